@@ -3,8 +3,30 @@ Format-specific configuration for Web Style Extractor
 Contains all text variations for different output formats
 """
 
-FORMAT_CONFIGS = {
-    'mediawiki': {
+import marshal
+import os
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+# Interned key constants for the hot getters: CPython's dict lookup tries
+# pointer equality before a full string compare, so interned keys hit the
+# fast path every time.
+_K_FILE_EXTENSION = sys.intern('file_extension')
+_K_TERMINAL_MESSAGE = sys.intern('terminal_message')
+_K_IMPORT_EXAMPLE = sys.intern('import_example')
+_K_HOWTO = sys.intern('_howto')
+_K_CAPABILITIES = sys.intern('_capabilities')
+_K_USE_CASES = sys.intern('_use_cases')
+
+# Shared section headers, defined once instead of repeated per format
+_HOWTO_HEADER = '## 🚀 How to Use This Information'
+_CAPABILITIES_HEADER = '### ✨ Capabilities'
+_USE_CASES_HEADER = '### 🎯 Use Cases'
+
+def _load_mediawiki():
+    return {
         'name': 'MediaWiki',
         'file_extension': 'mediawiki',
         'emoji': '📝',
@@ -39,9 +61,10 @@ FORMAT_CONFIGS = {
 # Copy the generated file to your wiki
 cp styles.mediawiki /path/to/wiki/
 ```"""
-    },
-    
-    'json': {
+    }
+
+def _load_json():
+    return {
         'name': 'JSON',
         'file_extension': 'json',
         'emoji': '💾',
@@ -79,9 +102,10 @@ import styles from './styles.json';
 const colors = styles.colors;
 const fonts = styles.fonts;
 ```"""
-    },
-    
-    'modern-css': {
+    }
+
+def _load_modern_css():
+    return {
         'name': 'Modern CSS',
         'file_extension': 'css',
         'emoji': '🚀',
@@ -129,9 +153,10 @@ const fonts = styles.fonts;
   .card { display: grid; }
 }
 ```"""
-    },
-    
-    'css': {
+    }
+
+def _load_css():
+    return {
         'name': 'CSS',
         'file_extension': 'css',
         'emoji': '🎨',
@@ -168,9 +193,10 @@ const fonts = styles.fonts;
 <!-- Or import in CSS -->
 @import url('styles.css');
 ```"""
-    },
-    
-    'tailwind': {
+    }
+
+def _load_tailwind():
+    return {
         'name': 'Tailwind CSS',
         'file_extension': 'js',
         'emoji': '⚡',
@@ -210,9 +236,10 @@ module.exports = require('./styles.js');
   Styled with extracted colors!
 </div>
 ```"""
-    },
-    
-    'design-tokens': {
+    }
+
+def _load_design_tokens():
+    return {
         'name': 'Design Tokens',
         'file_extension': 'json',
         'emoji': '🎯',
@@ -261,9 +288,10 @@ StyleDictionary.extend({
   }
 }).buildAllPlatforms();
 ```"""
-    },
-    
-    'html': {
+    }
+
+def _load_html():
+    return {
         'name': 'HTML Report',
         'file_extension': 'html',
         'emoji': '📊',
@@ -301,57 +329,173 @@ StyleDictionary.extend({
 <iframe src="styles.html" width="100%" height="600"></iframe>
 ```"""
     }
+
+_FORMAT_LOADERS = {
+    'mediawiki': _load_mediawiki,
+    'json': _load_json,
+    'modern-css': _load_modern_css,
+    'css': _load_css,
+    'tailwind': _load_tailwind,
+    'design-tokens': _load_design_tokens,
+    'html': _load_html,
 }
 
+# Formats available, in registration order
+FORMAT_NAMES = tuple(_FORMAT_LOADERS)
+
+# Optional marshalled snapshot of all configs, written by running this module
+# directly (python format_configs.py). Loading it skips the loader bytecode
+# entirely; the source literals above remain the fallback and the snapshot is
+# ignored whenever it is older than this file.
+_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'format_configs.bin')
+
+def _load_config_snapshot():
+    """Load the marshalled config snapshot, or None if missing/stale"""
+    try:
+        if os.path.getmtime(_CACHE_PATH) < os.path.getmtime(__file__):
+            return None
+        with open(_CACHE_PATH, 'rb') as cache_file:
+            return marshal.load(cache_file)
+    except (OSError, ValueError, EOFError):
+        return None
+
+_CONFIG_SNAPSHOT = _load_config_snapshot()
+
+# Unknown format names fall back to the JSON config
+_DEFAULT_FORMAT = 'json'
+
+# Shared string pool: values repeated across formats (the 'css' extension,
+# 'Component libraries', ...) collapse to a single interned instance.
+_STRING_POOL = {}
+
+def _canon(value):
+    """Canonicalize a config value through the shared string pool"""
+    if isinstance(value, str):
+        return _STRING_POOL.setdefault(value, sys.intern(value))
+    if isinstance(value, list):
+        return [_canon(item) for item in value]
+    return value
+
+def _finalize(config: dict) -> dict:
+    """Attach the precomputed rendered sections to a freshly loaded config.
+
+    A config never changes after loading, so the list fields are joined and
+    the sections rendered once here instead of on every call. The joined
+    text is kept on the config so no caller needs to re-join the lists.
+    """
+    config = {sys.intern(key): _canon(value) for key, value in config.items()}
+    instructions = config['howto_instructions_text'] = '\n'.join(config['howto_instructions'])
+    capabilities = config['capabilities_text'] = '\n'.join(f'- {cap}' for cap in config['capabilities'])
+    use_cases = config['use_cases_text'] = '\n'.join(f'- {case}' for case in config['use_cases'])
+    config[_K_HOWTO] = f"""{_HOWTO_HEADER}
+
+### {config['howto_title']}
+{instructions}
+
+{config['howto_description']}"""
+    config[_K_CAPABILITIES] = f"""{_CAPABILITIES_HEADER}
+{capabilities}"""
+    config[_K_USE_CASES] = f"""{_USE_CASES_HEADER}
+{use_cases}"""
+    # Only the MediaWiki message carries path placeholders; flag it once so
+    # get_terminal_message can skip the formatting pass for the rest.
+    message = config[_K_TERMINAL_MESSAGE]
+    config['_needs_paths'] = '{output_path}' in message or '{html_path}' in message
+    # Freeze the finished config: the memoized dicts are shared between all
+    # callers, so none of them may mutate what another one reads.
+    return MappingProxyType(config)
+
+@lru_cache(maxsize=32)
 def get_format_config(format_name: str) -> dict:
     """Get configuration for a specific format"""
-    return FORMAT_CONFIGS.get(format_name, FORMAT_CONFIGS['json'])
+    loader = _FORMAT_LOADERS.get(format_name)
+    if loader is None:
+        # Recurse so every unknown name shares the cached default config
+        return get_format_config(_DEFAULT_FORMAT)
+    if _CONFIG_SNAPSHOT is not None:
+        return _finalize(_CONFIG_SNAPSHOT[format_name])
+    return _finalize(loader())
+
+# Flat extension table (mirrors the loaders' file_extension fields) so path
+# construction is a single dict lookup and never has to load a full config
+_EXT = {
+    'mediawiki': 'mediawiki',
+    'json': 'json',
+    'modern-css': 'css',
+    'css': 'css',
+    'tailwind': 'js',
+    'design-tokens': 'json',
+    'html': 'html',
+}
 
 def get_file_extension(format_name: str) -> str:
     """Get file extension for a format"""
-    config = get_format_config(format_name)
-    return config['file_extension']
+    return _EXT.get(format_name, 'json')
+
+class _SafeDict(dict):
+    """Format mapping that leaves unknown placeholders untouched"""
+    def __missing__(self, key):
+        return '{' + key + '}'
 
 def get_terminal_message(format_name: str, output_path: str = None, html_path: str = None) -> str:
     """Get formatted terminal message for a format"""
     config = get_format_config(format_name)
-    message = config['terminal_message']
-    
-    if output_path and '{output_path}' in message:
-        message = message.replace('{output_path}', str(output_path))
-    if html_path and '{html_path}' in message:
-        message = message.replace('{html_path}', str(html_path))
-    
-    return message
+    if not config['_needs_paths']:
+        return config[_K_TERMINAL_MESSAGE]
 
-def get_howto_section(format_name: str) -> str:
-    """Get the How To Use section for a format"""
-    config = get_format_config(format_name)
-    
-    instructions = '\n'.join(config['howto_instructions'])
-    
-    return f"""## 🚀 How to Use This Information
+    fields = _SafeDict()
+    if output_path:
+        fields['output_path'] = str(output_path)
+    if html_path:
+        fields['html_path'] = str(html_path)
 
-### {config['howto_title']}
-{instructions}
+    return config[_K_TERMINAL_MESSAGE].format_map(fields)
 
-{config['howto_description']}"""
+@dataclass(frozen=True, slots=True)
+class FormatSections:
+    """Precomputed per-format strings bundled for attribute access.
+
+    Render loops can hold one of these and read attributes directly,
+    skipping a function call plus dict lookup per section.
+    """
+    howto: str
+    capabilities: str
+    use_cases: str
+    import_example: str
+    extension: str
+    terminal_message_template: str
+
+@lru_cache(maxsize=32)
+def get_format_sections(format_name: str) -> FormatSections:
+    """Get the precomputed section bundle for a format"""
+    config = get_format_config(format_name)
+    return FormatSections(
+        howto=config[_K_HOWTO],
+        capabilities=config[_K_CAPABILITIES],
+        use_cases=config[_K_USE_CASES],
+        import_example=config[_K_IMPORT_EXAMPLE],
+        extension=config[_K_FILE_EXTENSION],
+        terminal_message_template=config[_K_TERMINAL_MESSAGE],
+    )
+
+def get_howto_section(format_name: str) -> str:
+    """Get the How To Use section for a format"""
+    return get_format_sections(format_name).howto
 
 def get_capabilities_section(format_name: str) -> str:
     """Get capabilities list for a format"""
-    config = get_format_config(format_name)
-    capabilities = '\n'.join(f'- {cap}' for cap in config['capabilities'])
-    return f"""### ✨ Capabilities
-{capabilities}"""
+    return get_format_sections(format_name).capabilities
 
 def get_use_cases_section(format_name: str) -> str:
     """Get use cases for a format"""
-    config = get_format_config(format_name)
-    use_cases = '\n'.join(f'- {case}' for case in config['use_cases'])
-    return f"""### 🎯 Use Cases
-{use_cases}"""
+    return get_format_sections(format_name).use_cases
 
 def get_import_example(format_name: str) -> str:
     """Get import example for a format"""
-    config = get_format_config(format_name)
-    return config['import_example']
\ No newline at end of file
+    return get_format_sections(format_name).import_example
+
+if __name__ == '__main__':
+    # Regenerate the marshalled snapshot next to this module
+    with open(_CACHE_PATH, 'wb') as cache_file:
+        marshal.dump({name: loader() for name, loader in _FORMAT_LOADERS.items()}, cache_file)
+    print(f"Config snapshot written to: {_CACHE_PATH}")
\ No newline at end of file
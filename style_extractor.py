@@ -1,32 +1,439 @@
 #!/usr/bin/env python3
 
 import argparse
-import cssutils
+import atexit
+import contextlib
 import logging
+import os
 import re
+import sys
+import threading
 import bs4
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from PIL import Image, UnidentifiedImageError
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from urllib.parse import urljoin, urlparse
 import requests
-from typing import List, Dict, Any, Optional
-import io
-import selenium.common.exceptions
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from types import MappingProxyType
+from typing import Any, Dict, Final, List, Optional
 import json
 import datetime
+import hashlib
 import math
-import colorsys
-from format_configs import get_format_config, get_file_extension, get_terminal_message, get_howto_section
+from functools import cached_property, lru_cache
+from format_configs import get_format_config, get_file_extension, get_terminal_message
 from version import get_display_name, get_version_string, __version__
 
-# Set up logging (will be configured based on debug flag)
-cssutils.log.setLevel('CRITICAL')
+# selenium and webdriver_manager are imported lazily inside _get_driver so
+# CLI start-up does not pay for them before computed styles are needed
+
+# Windows consoles default to a legacy codepage; switch stdout to UTF-8 once
+# at import so the emoji output renders instead of raising UnicodeEncodeError
+if sys.platform == 'win32':
+    with contextlib.suppress(Exception):
+        sys.stdout.reconfigure(encoding='utf-8')
+
+# Prefer lxml's C-based parser for BeautifulSoup; it tokenizes several times
+# faster than the pure-Python html.parser. Fall back if not installed.
+try:
+    import lxml  # noqa: F401
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    _SOUP_PARSER = 'html.parser'
+
+# Optional linear-time regex engine (pip install google-re2) for the feature
+# detection patterns: RE2 executes without backtracking, so adversarial CSS
+# cannot trigger pathological re-scans
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+def _compile_linear(pattern: str):
+    """Compile with RE2 when available, falling back to the stdlib engine"""
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+# Precompiled patterns for the CSS scanning paths; compiling once at import
+# avoids re-parsing the patterns for every page/stylesheet analyzed
+_HEX_RE = re.compile(r'#(?:[0-9a-fA-F]{3,4}){1,2}\b')
+_RGB_RE = re.compile(r'rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)(?:,\s*[\d.]+)?\)')
+_FONT_FAMILY_RE = re.compile(r'font-family\s*:\s*([^;}]+)', re.IGNORECASE)
+# One C-level scan for the monospace font names, shared by every classifier
+_MONO_RE = re.compile(r'mono|consolas|courier|menlo|monaco|sfmono', re.IGNORECASE)
+# Badge-class dispatch: one case-insensitive scan plus a lastindex lookup
+# instead of six lowered substring checks per usage string
+_FONT_CLASS_RE = re.compile(r'(monospace|code)|(system|ui)|(serif)|(keyword)|(fallback)',
+                            re.IGNORECASE)
+_CLASS_MAP = {1: 'monospace', 2: 'system', 3: 'serif', 4: 'keyword', 5: 'fallback'}
+_QUOTE_TBL = str.maketrans('', '', '"\'')
+_NL = "\n"
+_CSS_VAR_RE = re.compile(r'--([a-zA-Z0-9-_]+)\s*:\s*([^;}]+)')
+_CONTAINER_RE = _compile_linear(r'@container[^{]*{[^}]*}')
+_NESTING_RE = _compile_linear(r'&\s*[^{]*{[^}]*}')
+_HAS_RE = _compile_linear(r':has\([^)]*\)')
+_FLUID_RE = _compile_linear(r'(?:clamp|min|max)\([^)]*\)')
+_COLOR_FN_RE = _compile_linear(r'(?:oklch|lch|lab|color)\([^)]*\)')
+
+# Optional single-pass prefilter (pip install hyperscan) for the feature
+# patterns: one SIMD-accelerated traversal flags which patterns occur at all,
+# and the per-pattern findall runs only for those. Hyperscan's automata
+# report different match extents than findall, so it is used strictly as a
+# presence filter — extraction results are identical with or without it.
+try:
+    import hyperscan as _hyperscan
+except ImportError:
+    _hyperscan = None
+
+# Optional NumPy acceleration for batch color math
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional Rust-backed JSON encoder for the JSON/design-token outputs
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+def _json_dumps(obj) -> str:
+    """Serialize to 2-space-indented JSON, via orjson when installed"""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+# Lighten amounts for Tailwind shades 50-300; reversed they are the darken
+# amounts for shades 600-900
+_SHADE_AMOUNTS = (0.4, 0.3, 0.2, 0.1)
+
+def _shade_scale(hex_color: str) -> Optional[Dict[str, str]]:
+    """Compute a Tailwind 50-900 shade scale in two vectorized NumPy ops.
+
+    Returns None when NumPy is missing or the color is not 6-digit hex,
+    in which case the caller falls back to the scalar helpers.
+    """
+    if np is None:
+        return None
+    try:
+        rgb = np.frombuffer(bytes.fromhex(hex_color.lstrip('#')), dtype=np.uint8)
+    except ValueError:
+        return None
+    if rgb.shape != (3,):
+        return None
+
+    amounts = np.asarray(_SHADE_AMOUNTS)[:, None]
+    light = (rgb + (255 - rgb) * amounts).astype(np.uint8)
+    dark = (rgb * (1 - amounts[::-1])).astype(np.uint8)
+
+    scale = {shade: '#' + row.tobytes().hex()
+             for shade, row in zip(('50', '100', '200', '300'), light)}
+    scale['400'] = hex_color
+    scale['500'] = hex_color  # Base color
+    scale.update((shade, '#' + row.tobytes().hex())
+                 for shade, row in zip(('600', '700', '800', '900'), dark))
+    return scale
+
+# OKLab conversion matrices (Björn Ottosson's reference values):
+# linear sRGB -> LMS, then cube-rooted LMS -> OKLab
+_OKLAB_M1 = (
+    (0.4122214708, 0.5363325363, 0.0514459929),
+    (0.2119034982, 0.6806995451, 0.1073969566),
+    (0.0883024619, 0.2817188376, 0.6299787005),
+)
+_OKLAB_M2 = (
+    (0.2104542553, 0.7936177850, -0.0040720468),
+    (1.9779984951, -2.4285922050, 0.4505937099),
+    (0.0259040371, 0.7827717662, -0.8086757660),
+)
+
+def _srgb_to_linear(channel: float) -> float:
+    """Remove the sRGB gamma from a 0-1 channel value"""
+    if channel <= 0.04045:
+        return channel / 12.92
+    return ((channel + 0.055) / 1.055) ** 2.4
+
+def rgb_to_oklch_batch(rgb_array) -> List[tuple]:
+    """Convert an (N, 3) array of 0-255 RGB rows to (L%, C, H) tuples.
+
+    Vectorized through NumPy when available: two 3x3 matrix products
+    replace N Python-level conversions, which matters when converting a
+    full CSS palette rather than a handful of colors.
+    """
+    if np is None:
+        return [ColorConverter.rgb_to_oklch(r, g, b) for r, g, b in rgb_array]
+
+    srgb = np.asarray(rgb_array, dtype=np.float64) / 255.0
+    linear = np.where(srgb <= 0.04045, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+    lab = np.cbrt(linear @ np.asarray(_OKLAB_M1).T) @ np.asarray(_OKLAB_M2).T
+    lightness = lab[:, 0] * 100
+    chroma = np.hypot(lab[:, 1], lab[:, 2])
+    hue = np.degrees(np.arctan2(lab[:, 2], lab[:, 1])) % 360
+    return list(zip(lightness.tolist(), chroma.tolist(), hue.tolist()))
+
+_FEATURE_PATTERNS = (
+    ('container_queries', _CONTAINER_RE, rb'@container[^{]*\{[^}]*\}'),
+    ('css_nesting', _NESTING_RE, rb'&\s*[^{]*\{[^}]*\}'),
+    ('has_selectors', _HAS_RE, rb':has\([^)]*\)'),
+    ('fluid_typography', _FLUID_RE, rb'(?:clamp|min|max)\([^)]*\)'),
+    ('color_functions', _COLOR_FN_RE, rb'(?:oklch|lch|lab|color)\([^)]*\)'),
+)
+
+_FEATURE_DB = None
+if _hyperscan is not None:
+    try:
+        _FEATURE_DB = _hyperscan.Database(mode=_hyperscan.HS_MODE_BLOCK)
+        _FEATURE_DB.compile(
+            expressions=[expr for _, _, expr in _FEATURE_PATTERNS],
+            ids=list(range(len(_FEATURE_PATTERNS))),
+            flags=[_hyperscan.HS_FLAG_SINGLEMATCH] * len(_FEATURE_PATTERNS)
+        )
+    except Exception:
+        _FEATURE_DB = None
+
+# Memoized results of the pure CSS scans, keyed by (scan kind, content hash).
+# Repeat extractions of the same stylesheet blob skip the regex work; keys
+# store a 16-byte digest rather than the CSS itself to keep memory bounded.
+_CSS_SCAN_CACHE = {}
+_CSS_SCAN_CACHE_MAX = 512
+
+def _cached_css_scan(kind: str, css_text: str, scan):
+    """Memoize scan(css_text) under the content hash of css_text"""
+    key = (kind, hashlib.blake2b(css_text.encode(), digest_size=16).digest())
+    result = _CSS_SCAN_CACHE.get(key)
+    if result is None:
+        if len(_CSS_SCAN_CACHE) >= _CSS_SCAN_CACHE_MAX:
+            _CSS_SCAN_CACHE.pop(next(iter(_CSS_SCAN_CACHE)))
+        result = _CSS_SCAN_CACHE[key] = scan(css_text)
+    return result
+
+# Constant design-token scales; none of these depend on the extracted data,
+# so they live here as read-only mappings instead of being rebuilt as fresh
+# literals on every generate_design_tokens call
+_SPACING_SCALE = MappingProxyType({
+    "3xs": {"value": "0.25rem", "px": "4px"},
+    "2xs": {"value": "0.5rem", "px": "8px"},
+    "xs": {"value": "0.75rem", "px": "12px"},
+    "sm": {"value": "1rem", "px": "16px"},
+    "md": {"value": "1.5rem", "px": "24px"},
+    "lg": {"value": "2rem", "px": "32px"},
+    "xl": {"value": "3rem", "px": "48px"},
+    "2xl": {"value": "4rem", "px": "64px"},
+    "3xl": {"value": "6rem", "px": "96px"}
+})
+
+_FONT_SIZES = MappingProxyType({
+    "xs": {"value": "clamp(0.75rem, 1.5vw, 0.875rem)", "static": "0.75rem"},
+    "sm": {"value": "clamp(0.875rem, 2vw, 1rem)", "static": "0.875rem"},
+    "base": {"value": "clamp(1rem, 2.5vw, 1.125rem)", "static": "1rem"},
+    "lg": {"value": "clamp(1.125rem, 3vw, 1.375rem)", "static": "1.125rem"},
+    "xl": {"value": "clamp(1.375rem, 4vw, 1.875rem)", "static": "1.375rem"},
+    "2xl": {"value": "clamp(1.875rem, 5vw, 2.5rem)", "static": "1.875rem"}
+})
+
+_BORDER_RADIUS = MappingProxyType({
+    "none": "0",
+    "sm": "0.125rem",
+    "base": "0.25rem",
+    "md": "0.375rem",
+    "lg": "0.5rem",
+    "xl": "0.75rem",
+    "2xl": "1rem",
+    "full": "9999px"
+})
+
+_SHADOWS = MappingProxyType({
+    "xs": "0 1px 2px 0 rgba(0, 0, 0, 0.05)",
+    "sm": "0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",
+    "base": "0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)",
+    "md": "0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)",
+    "lg": "0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05)",
+    "xl": "0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04)",
+    "2xl": "0 25px 50px -12px rgba(0, 0, 0, 0.25)"
+})
+
+@lru_cache(maxsize=1)
+def _constant_token_sections() -> tuple:
+    """Expand the constant scales into their token wrapper dicts once.
+
+    The spacing, font-size, border-radius and shadow sections are
+    identical for every output, so the per-entry wrapper dicts are built
+    on first use and shared across all subsequent token exports.
+    """
+    spacing = {name: {"value": values["value"], "pixel": values["px"],
+                      "type": "dimension", "description": f"Spacing {name}"}
+               for name, values in _SPACING_SCALE.items()}
+    font_sizes = {name: {"value": values["value"], "static": values["static"],
+                         "type": "fontSize.fluid", "description": f"Font size {name}"}
+                  for name, values in _FONT_SIZES.items()}
+    border_radius = {name: {"value": value, "type": "borderRadius",
+                            "description": f"Border radius {name}"}
+                     for name, value in _BORDER_RADIUS.items()}
+    shadows = {name: {"value": value, "type": "boxShadow",
+                      "description": f"Box shadow {name}"}
+               for name, value in _SHADOWS.items()}
+    return spacing, font_sizes, border_radius, shadows
+
+@lru_cache(maxsize=256)
+def _font_usage(font: str) -> str:
+    """Determine the usage category for a font"""
+    font_lower = font.lower()
+
+    if _MONO_RE.search(font_lower):
+        return "Monospace/Code"
+    elif font_lower in {'-apple-system', 'blinkmacsystemfont', 'segoe ui', 'roboto', 'helvetica neue', 'arial'}:
+        return "UI/System"
+    elif font_lower in {'times', 'georgia', 'serif'}:
+        return "Serif/Reading"
+    elif font_lower in {'inherit', 'initial', 'unset'}:
+        return "CSS Keyword"
+    elif 'sans-serif' in font_lower or 'sans' in font_lower:
+        return "Sans-serif Fallback"
+    elif 'serif' in font_lower:
+        return "Serif Fallback"
+    else:
+        return "Display/Custom"
+
+@lru_cache(maxsize=256)
+def _font_classification(font: str) -> str:
+    """Get detailed font classification"""
+    font_lower = font.lower()
+
+    if _MONO_RE.search(font_lower):
+        return "**Monospace** 🔤"
+    elif font_lower in {'-apple-system', 'blinkmacsystemfont', 'segoe ui', 'roboto', 'helvetica neue'}:
+        return "**System UI** 💻"
+    elif font_lower in {'times', 'times new roman', 'georgia', 'baskerville'}:
+        return "**Serif** 📚"
+    elif font_lower in {'helvetica', 'arial', 'verdana', 'tahoma'}:
+        return "**Sans-serif** ✏️"
+    elif font_lower in {'inherit', 'initial', 'unset', 'auto'}:
+        return "**CSS Keyword** ⚙️"
+    elif 'display' in font_lower or 'heading' in font_lower:
+        return "**Display** 🎨"
+    else:
+        return "**Custom** ✨"
+
+@lru_cache(maxsize=256)
+def _font_fallback(font: str) -> str:
+    """Get recommended fallback strategy"""
+    font_lower = font.lower()
+
+    if _MONO_RE.search(font_lower):
+        return "`monospace, 'Courier New'`"
+    elif font_lower in {'-apple-system', 'blinkmacsystemfont'}:
+        return "`system-ui, sans-serif`"
+    elif font_lower in {'segoe ui', 'roboto', 'helvetica neue', 'arial'}:
+        return "`sans-serif, Arial`"
+    elif font_lower in {'times', 'georgia'}:
+        return "`serif, 'Times New Roman'`"
+    elif font_lower in {'inherit', 'initial', 'unset'}:
+        return "*Inherits parent*"
+    else:
+        return "`sans-serif` *(generic)*"
+
+@lru_cache(maxsize=256)
+def _font_css_class(usage: str) -> str:
+    """Get CSS class for font usage badge"""
+    m = _FONT_CLASS_RE.search(usage)
+    return _CLASS_MAP[m.lastindex] if m else 'custom'
+
+@lru_cache(maxsize=64)
+def _read_template(path_str: str, mtime_ns: int) -> str:
+    """Read a template file once per (path, mtime) pair.
+
+    Keying on st_mtime_ns means an edited template is re-read on the next
+    call while repeat extractions reuse the cached text.
+    """
+    return Path(path_str).read_text(encoding='utf-8')
+
+def _write_small(path: Path, text: str) -> None:
+    """Write a small text file through a raw fd in one syscall
+
+    For payloads that fit a single write, os.open/os.write skips the
+    buffered text-IO layer that open() would set up just to flush once.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, text.encode('utf-8'))
+    finally:
+        os.close(fd)
+
+def _dominant_colors(img: Image.Image, count: int = 3) -> List[str]:
+    """Return the dominant colors of an RGB image as hex strings"""
+    # FASTOCTREE builds a reduced palette in a single linear libImaging pass;
+    # unlike exact pixel counting it also gives sensible dominant colors for
+    # continuous-tone photos, where no two pixels are quite the same
+    palette_img = img.quantize(colors=count, method=Image.Quantize.FASTOCTREE)
+    palette = palette_img.getpalette()
+    # Rank the used palette slots by pixel count; the raw palette is
+    # zero-padded, so unused slots must not leak through as black
+    used = palette_img.getcolors() or []
+    used.sort(reverse=True)
+    return [
+        f'#{palette[3*idx]:02x}{palette[3*idx+1]:02x}{palette[3*idx+2]:02x}'
+        for _, idx in used[:count]
+    ]
+
+def _scan_css_colors(css_text: str) -> List[str]:
+    """Collect normalized hex colors from CSS text"""
+    normalized_colors = []
+
+    # finditer yields match objects lazily instead of materializing every
+    # hex token into an intermediate list first
+    for match in _HEX_RE.finditer(css_text):
+        color = match.group()
+        if len(color) == 4:
+            color = f'#{color[1]}{color[1]}{color[2]}{color[2]}{color[3]}{color[3]}'
+        normalized_colors.append(color.lower())
+
+    for match in _RGB_RE.finditer(css_text):
+        r, g, b = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        normalized_colors.append(f'#{r:02x}{g:02x}{b:02x}')
+
+    return normalized_colors
+
+def _scan_fonts(css_text: str) -> List[str]:
+    """Collect font-family values from CSS text"""
+    fonts = []
+    for match in _FONT_FAMILY_RE.finditer(css_text):
+        font_list = [f.strip() for f in match.group(1).translate(_QUOTE_TBL).split(',')]
+        fonts.extend(font_list)
+    return fonts
+
+def _scan_custom_properties(css_text: str) -> Dict[str, str]:
+    """Collect CSS custom properties (--name: value) from CSS text"""
+    custom_props = {}
+    for prop_name, prop_value in _CSS_VAR_RE.findall(css_text):
+        value = prop_value.strip().rstrip(';')
+        custom_props[f'--{prop_name}'] = value
+    return custom_props
+
+def _scan_modern_features(css_text: str) -> Dict[str, List[str]]:
+    """Collect modern CSS feature usages from CSS text"""
+    present = None
+    if _FEATURE_DB is not None:
+        present = set()
+        _FEATURE_DB.scan(
+            css_text.encode(),
+            match_event_handler=lambda pat_id, from_, to, flags, ctx: present.add(pat_id)
+        )
+
+    features = {'custom_properties': []}
+    for pat_id, (name, pattern, _) in enumerate(_FEATURE_PATTERNS):
+        if present is None or pat_id in present:
+            features[name] = pattern.findall(css_text)
+        else:
+            features[name] = []
+    return features
 @dataclass
 class WebStyleData:
     url: str
@@ -38,1695 +445,1758 @@ class WebStyleData:
     body_font: str
     css_text: str = ""
 
+    @cached_property
+    def domain(self) -> str:
+        """Hostname of the source URL, parsed once per instance"""
+        return urlparse(self.url).netloc
+
+# Cached at module level: the conversions are pure and the same handful of
+# extracted colors is converted many times per render (lru_cache on a
+# staticmethod directly has historical pitfalls, so cache the plain functions)
+@lru_cache(maxsize=1024)
+def _hex_to_rgb_cached(hex_color: str) -> tuple:
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) == 3:
+        hex_color = ''.join([c*2 for c in hex_color])
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+# The OKLCH strings live in a plain dict rather than an lru_cache so the
+# palette-wide converter below can prime many entries from one batch call
+_OKLCH_STRING_CACHE: Dict[str, str] = {}
+_OKLCH_STRING_CACHE_MAX = 1024
+
+def _oklch_string(l: float, c: float, h: float) -> str:
+    return f"oklch({l:.1f}% {c:.3f} {h:.1f}deg)"
+
+def _oklch_cache_store(hex_color: str, value: str) -> None:
+    if len(_OKLCH_STRING_CACHE) >= _OKLCH_STRING_CACHE_MAX:
+        _OKLCH_STRING_CACHE.pop(next(iter(_OKLCH_STRING_CACHE)))
+    _OKLCH_STRING_CACHE[hex_color] = value
+
+def _hex_to_oklch_cached(hex_color: str) -> str:
+    result = _OKLCH_STRING_CACHE.get(hex_color)
+    if result is None:
+        try:
+            r, g, b = ColorConverter.hex_to_rgb(hex_color)
+        except Exception:
+            return f"oklch(50% 0.1 0deg)  /* fallback for {hex_color} */"
+        result = _oklch_string(*ColorConverter.rgb_to_oklch(r, g, b))
+        _oklch_cache_store(hex_color, result)
+    return result
+
+def _hex_to_oklch_map(colors) -> Dict[str, str]:
+    """Resolve OKLCH strings for a whole palette in one batch.
+
+    Unique colors missing from the cache go through a single
+    rgb_to_oklch_batch call — two matrix products for the entire palette
+    instead of a scalar cbrt/atan2 round-trip per color.
+    """
+    oklch_map = dict.fromkeys(colors)
+    missing = []
+    for color in oklch_map:
+        cached = _OKLCH_STRING_CACHE.get(color)
+        if cached is not None:
+            oklch_map[color] = cached
+            continue
+        try:
+            missing.append((color, ColorConverter.hex_to_rgb(color)))
+        except Exception:
+            oklch_map[color] = f"oklch(50% 0.1 0deg)  /* fallback for {color} */"
+    if missing:
+        converted = rgb_to_oklch_batch([rgb for _, rgb in missing])
+        for (color, _), (l, c, h) in zip(missing, converted):
+            value = _oklch_string(l, c, h)
+            _oklch_cache_store(color, value)
+            oklch_map[color] = value
+    return oklch_map
+
 class ColorConverter:
     """Modern color conversion utilities for OKLCH and other color spaces"""
-    
+
     @staticmethod
     def hex_to_rgb(hex_color: str) -> tuple:
         """Convert hex color to RGB tuple"""
-        hex_color = hex_color.lstrip('#')
-        if len(hex_color) == 3:
-            hex_color = ''.join([c*2 for c in hex_color])
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-    
+        return _hex_to_rgb_cached(hex_color)
+
     @staticmethod
     def rgb_to_oklch(r: int, g: int, b: int) -> tuple:
-        """Convert RGB to OKLCH (simplified approximation)"""
-        # Convert to 0-1 range
-        r_norm, g_norm, b_norm = r/255, g/255, b/255
-        
-        # Convert to HSL for hue component
-        h, l, s = colorsys.rgb_to_hls(r_norm, g_norm, b_norm)
-        
-        # Approximate OKLCH conversion (simplified for demo)
-        # In production, you'd use proper color space conversion
-        lightness = l * 100  # L: 0-100
-        chroma = s * 0.37    # C: approximate chroma
-        hue = h * 360        # H: 0-360 degrees
-        
+        """Convert RGB to OKLCH via the OKLab color space"""
+        linear = (_srgb_to_linear(r / 255), _srgb_to_linear(g / 255), _srgb_to_linear(b / 255))
+        cbrt_lms = [
+            math.cbrt(sum(coeff * channel for coeff, channel in zip(row, linear)))
+            for row in _OKLAB_M1
+        ]
+        lab_l, lab_a, lab_b = (
+            sum(coeff * value for coeff, value in zip(row, cbrt_lms))
+            for row in _OKLAB_M2
+        )
+
+        lightness = lab_l * 100  # L: 0-100
+        chroma = math.hypot(lab_a, lab_b)
+        hue = math.degrees(math.atan2(lab_b, lab_a)) % 360
+
         return (lightness, chroma, hue)
     
     @staticmethod
     def hex_to_oklch_string(hex_color: str) -> str:
         """Convert hex color to OKLCH CSS string"""
-        try:
-            r, g, b = ColorConverter.hex_to_rgb(hex_color)
-            l, c, h = ColorConverter.rgb_to_oklch(r, g, b)
-            return f"oklch({l:.1f}% {c:.3f} {h:.1f}deg)"
-        except:
-            return f"oklch(50% 0.1 0deg)  /* fallback for {hex_color} */"
-
-class WebStyleExtractor:
-    def __init__(self, url: str):
-        self.url = url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-
-    def fetch_page_content(self) -> Optional[BeautifulSoup]:
-        try:
-            response = self.session.get(self.url, timeout=10)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
-        except requests.RequestException as e:
-            logging.error(f"Error fetching page: {e}")
-            return None
-
-    def get_all_css(self, soup: BeautifulSoup) -> str:
-        css_text = ""
-
-        # Inline styles
-        for tag in soup.find_all(style=True):
-            if isinstance(tag, bs4.element.Tag):
-                style_attr = tag.get('style')
-                if style_attr:
-                    css_text += str(style_attr) + "\n"
-        for style in soup.find_all('style'):
-            style_content = getattr(style, 'string', None)
-            if style_content:
-                css_text += str(style_content) + "\n"
-        for link in soup.find_all('link', rel='stylesheet'):
-            if isinstance(link, bs4.element.Tag):
-                href = link.get('href')
-                if not href:
-                    continue
-
-                css_url = str(href)
-                if not css_url.startswith(('http', '//')):
-                    css_url = urljoin(self.url, css_url)
-                elif css_url.startswith('//'):
-                    css_url = f"https:{css_url}"
-
-                try:
-                    css_response = self.session.get(css_url, timeout=5)
-                    css_response.raise_for_status()
-                    css_text += css_response.text + "\n"
-                except requests.RequestException:
-                    continue
-        return css_text
-    def extract_colors(self, css_text: str, soup: BeautifulSoup) -> List[str]:
-        hex_pattern = r'#(?:[0-9a-fA-F]{3,4}){1,2}\b'
-        rgb_pattern = r'rgba?\(\s*\d+\s*,\s*\d+\s*,\s*\d+(?:,\s*[\d.]+)?\)'
-
-        hex_colors = re.findall(hex_pattern, css_text)
-        rgb_colors = re.findall(rgb_pattern, css_text)
-
-        normalized_colors = []
-
-        for color in hex_colors:
-            if len(color) == 4:
-                color = f'#{color[1]}{color[1]}{color[2]}{color[2]}{color[3]}{color[3]}'
-            normalized_colors.append(color.lower())
-
-        for color in rgb_colors:
-            numbers = list(map(int, re.findall(r'\d+', color)))
-            if len(numbers) >= 3:
-                hex_color = f'#{numbers[0]:02x}{numbers[1]:02x}{numbers[2]:02x}'
-                normalized_colors.append(hex_color)
-
-        # Try to extract dominant colors from the first image
-        try:
-            hero_image = soup.find('img')
-            if isinstance(hero_image, bs4.element.Tag):
-                img_src = hero_image.get('src')
-                if img_src:
-                    img_url = str(img_src)
-                    if not img_url.startswith(('http', '//')):
-                        img_url = urljoin(self.url, img_url)
-                    elif img_url.startswith('//'):
-                        img_url = f"https:{img_url}"
-
-                    img_response = self.session.get(img_url, timeout=5)
-                    img_response.raise_for_status()
-                    img = Image.open(io.BytesIO(img_response.content))
-                    img = img.convert('RGB')
-                    img = img.resize((100, 100))
-
-                    colors = img.getcolors(maxcolors=10000)
-                    if colors:
-                        colors.sort(key=lambda x: x[0], reverse=True)
-                        for _, color in colors[:3]:
-                            if isinstance(color, (tuple, list)) and len(color) >= 3:
-                                hex_color = f'#{color[0]:02x}{color[1]:02x}{color[2]:02x}'
-                                normalized_colors.append(hex_color)
-        except (requests.RequestException, UnidentifiedImageError, Exception):
-            pass
-
-        seen = set()
-        unique_colors = []
-        for color in normalized_colors:
-            if color not in seen:
-                seen.add(color)
-                unique_colors.append(color)
-
-        return unique_colors[:10]
-
-    def extract_fonts(self, css_text: str) -> List[str]:
-        fonts = []
-
-        try:
-            sheet = cssutils.parseString(css_text)
-            for rule in sheet:
-                if rule.type == rule.STYLE_RULE:
-                    for prop in rule.style:
-                        if prop.name == 'font-family':
-                            font_list = [f.strip().strip('"\'') for f in prop.value.split(',')]
-                            fonts.extend(font_list)
-        except Exception:
-            font_pattern = r'font-family\s*:\s*([^;]+)'
-            matches = re.findall(font_pattern, css_text, re.IGNORECASE)
-            for match in matches:
-                font_list = [f.strip().strip('"\'') for f in match.split(',')]
-                fonts.extend(font_list)
-
-        seen = set()
-        unique_fonts = []
-        for font in fonts:
-            if font and font not in seen:
-                seen.add(font)
-                unique_fonts.append(font)
-
-        return unique_fonts[:5]
-    
-    def extract_css_custom_properties(self, css_text: str) -> Dict[str, str]:
-        """Extract existing CSS custom properties (CSS variables)"""
-        custom_props = {}
+        return _hex_to_oklch_cached(hex_color)
+
+def _minify_html_template(tmpl: str) -> str:
+    """Strip indentation and blank lines from an HTML template.
+
+    Runs once at import, where the templates are defined, so every
+    rendered README.html shrinks without any per-render minification
+    cost. Leading whitespace is only cosmetic in the generated markup
+    (browsers collapse it), and a leading newline is preserved so
+    streamed chunks still join on line boundaries.
+    """
+    lines = [line.strip() for line in tmpl.split('\n')]
+    body = '\n'.join([line for line in lines if line])
+    return '\n' + body if tmpl.startswith('\n') else body
+
+# README.html is rendered from these module-level templates: the literals
+# are stored once at import and each render only runs placeholder
+# substitution (the CSS braces are doubled for str.format_map)
+_HTML_README_HEAD: Final[str] = _minify_html_template('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>🎨 Style Guide for {domain}</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            line-height: 1.6;
+            color: #333;
+            background: #fff;
+        }}
         
-        # Pattern to match CSS custom properties
-        # Matches: --property-name: value;
-        prop_pattern = r'--([a-zA-Z0-9-_]+)\s*:\s*([^;}]+)'
+        h1 {{ color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; }}
+        h2 {{ color: #34495e; margin-top: 30px; }}
+        h3 {{ color: #7f8c8d; }}
         
-        matches = re.findall(prop_pattern, css_text)
+        .meta-info {{
+            background: #f8f9fa;
+            padding: 15px;
+            border-radius: 5px;
+            margin: 20px 0;
+            border-left: 4px solid #3498db;
+        }}
         
-        for prop_name, prop_value in matches:
-            # Clean up the value
-            value = prop_value.strip().rstrip(';')
-            custom_props[f'--{prop_name}'] = value
-            
-        return custom_props
-    
-    def detect_modern_css_features(self, css_text: str) -> Dict[str, List[str]]:
-        """Detect modern CSS features like container queries, nesting, etc."""
-        features = {
-            'container_queries': [],
-            'css_nesting': [],
-            'has_selectors': [],
-            'custom_properties': [],
-            'fluid_typography': [],
-            'color_functions': []
-        }
+        .stats-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 15px;
+            margin: 20px 0;
+        }}
         
-        # Detect container queries
-        container_pattern = r'@container[^{]*{[^}]*}'
-        features['container_queries'] = re.findall(container_pattern, css_text)
+        .stat-card {{
+            background: #ecf0f1;
+            padding: 15px;
+            border-radius: 5px;
+            text-align: center;
+        }}
         
-        # Detect CSS nesting (& selector)
-        nesting_pattern = r'&\s*[^{]*{[^}]*}'
-        features['css_nesting'] = re.findall(nesting_pattern, css_text)
+        .stat-number {{ font-size: 24px; font-weight: bold; color: #2980b9; }}
+        .stat-label {{ font-size: 14px; color: #7f8c8d; }}
         
-        # Detect :has() selectors
-        has_pattern = r':has\([^)]*\)'
-        features['has_selectors'] = re.findall(has_pattern, css_text)
+        .color-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
+            gap: 15px;
+            margin: 20px 0;
+        }}
         
-        # Detect fluid typography (clamp, min, max)
-        fluid_pattern = r'(?:clamp|min|max)\([^)]*\)'
-        features['fluid_typography'] = re.findall(fluid_pattern, css_text)
+        .color-card {{
+            border: 1px solid #ddd;
+            border-radius: 8px;
+            overflow: hidden;
+            background: white;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }}
         
-        # Detect modern color functions
-        color_pattern = r'(?:oklch|lch|lab|color)\([^)]*\)'
-        features['color_functions'] = re.findall(color_pattern, css_text)
+        .color-swatch {{
+            height: 80px;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            color: white;
+            font-weight: bold;
+            text-shadow: 1px 1px 1px rgba(0,0,0,0.5);
+        }}
         
-        return features
-
-    def get_computed_styles(self) -> Dict[str, Any]:
-        chrome_options = Options()
-        chrome_options.binary_location = r"C:\Program Files\Google\Chrome\Application\chrome.exe"  # Specify Chrome binary location
-        chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--log-level=3')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-
-        service = Service(ChromeDriverManager().install())
-        try:
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except selenium.common.exceptions.WebDriverException as e:
-            logging.error(f"Error creating Chrome WebDriver: {e}")
-            return {
-                'body': {
-                    'background': '#ffffff',
-                    'font_family': 'Arial, sans-serif'
-                },
-                'headings': {
-                    'color': '#000000'
-                },
-                'links': {
-                    'color': '#0000ee'
-                }
-            }
-
-        styles = {
-            'body': {
-                'background': '#ffffff',
-                'font_family': 'Arial, sans-serif'
-            },
-            'headings': {
-                'color': '#000000'
-            },
-            'links': {
-                'color': '#0000ee'
-            }
-        }
-
-        try:
-            driver.get(self.url)
-
-            styles['body']['background'] = driver.execute_script(
-                "return window.getComputedStyle(document.body).backgroundColor") or '#ffffff'
-            styles['body']['font_family'] = driver.execute_script(
-                "return window.getComputedStyle(document.body).fontFamily") or 'Arial, sans-serif'
-
-            h1_element = driver.find_element('css selector', 'h1')
-            styles['headings']['color'] = driver.execute_script(
-                "return window.getComputedStyle(arguments[0]).color", h1_element) or '#000000'
-
-            a_element = driver.find_element('css selector', 'a')
-            styles['links']['color'] = driver.execute_script(
-                "return window.getComputedStyle(arguments[0]).color", a_element) or '#0000ee'
-
-        except Exception as e:
-            logging.error(f"Error getting computed styles: {e}")
-        finally:
-            driver.quit()
-
-        return styles
-
-    def extract_styles(self) -> Optional[WebStyleData]:
-        soup = self.fetch_page_content()
-        if not soup:
-            return None
-
-        css_text = self.get_all_css(soup)
-        colors = self.extract_colors(css_text, soup)
-        fonts = self.extract_fonts(css_text)
-        computed_styles = self.get_computed_styles()
-
-        return WebStyleData(
-            url=self.url,
-            colors=colors,
-            fonts=fonts,
-            body_bg=computed_styles['body']['background'],
-            heading_color=computed_styles['headings']['color'],
-            link_color=computed_styles['links']['color'],
-            body_font=computed_styles['body']['font_family'],
-            css_text=css_text
-        )
-
-    def generate_template(self, data: WebStyleData, output_format: str) -> str:
-        # Handle special output formats separately
-        if output_format == 'json':
-            return self.generate_json_output(data)
-        elif output_format == 'css':
-            return self.generate_css_output(data)
-        elif output_format == 'modern-css':
-            return self.generate_modern_css_output(data, data.css_text)
-        elif output_format == 'tailwind':
-            return self.generate_tailwind_config(data)
-        elif output_format == 'design-tokens':
-            return self.generate_design_tokens(data)
+        .color-info {{
+            padding: 10px;
+            text-align: center;
+        }}
         
-        template_dir = Path(__file__).parent / 'templates'
-        if not template_dir.exists():
-            logging.error("Template directory not found.")
-            return ""
-
-        # Fix file extensions for MediaWiki templates
-        if output_format == 'mediawiki':
-            base_template_path = template_dir / f'base_{output_format}.wiki'
-            color_table_path = template_dir / f'color_table_{output_format}.wiki'
-            font_table_path = template_dir / f'font_table_{output_format}.wiki'
-        else:
-            base_template_path = template_dir / f'base_{output_format}.{output_format}'
-            color_table_path = template_dir / f'color_table_{output_format}.{output_format}'
-            font_table_path = template_dir / f'font_table_{output_format}.{output_format}'
-
-        try:
-            if not all([base_template_path.exists(), color_table_path.exists(), font_table_path.exists()]):
-                logging.error(f"One or more template files not found for format: {output_format}")
-                logging.error(f"Looking for: {base_template_path}, {color_table_path}, {font_table_path}")
-                return ""
-            base_template = base_template_path.read_text(encoding='utf-8')
-            color_table_template = color_table_path.read_text(encoding='utf-8')
-            font_table_template = font_table_path.read_text(encoding='utf-8')
-        except Exception as e:
-            logging.error(f"Error reading template files: {e}")
-            return ""
-
-        color_rows = []
-        for color in data.colors:
-            color_rows.append(color_table_template.format(color=color))
-
-        font_rows = []
-        for font in data.fonts:
-            font_rows.append(font_table_template.format(font=font))
-
-        return base_template.format(
-            url=data.url,
-            body_bg=data.body_bg,
-            body_font=data.body_font,
-            heading_color=data.heading_color,
-            link_color=data.link_color,
-            color_rows="\n".join(color_rows),
-            font_rows="\n".join(font_rows)
-        )
-
-    def generate_json_output(self, data: WebStyleData) -> str:
-        """Generate JSON output format"""
-        json_data = {
-            "url": data.url,
-            "extraction_date": datetime.datetime.now().isoformat() + "Z",
-            "styles": {
-                "body_background": data.body_bg,
-                "body_font": data.body_font,
-                "heading_color": data.heading_color,
-                "link_color": data.link_color
-            },
-            "colors": data.colors,
-            "fonts": data.fonts,
-            "metadata": {
-                "extractor_version": "1.0",
-                "total_colors_found": len(data.colors),
-                "total_fonts_found": len(data.fonts),
-                "extraction_method": "css_analysis_and_computed_styles",
-                "browser_used": "Chrome (headless)"
-            }
-        }
-        return json.dumps(json_data, indent=2, ensure_ascii=False)
-    
-    def generate_modern_css_output(self, data: WebStyleData, css_text: str = "") -> str:
-        """Generate modern CSS with OKLCH colors and advanced features"""
-        custom_props = self.extract_css_custom_properties(css_text) if css_text else {}
-        modern_features = self.detect_modern_css_features(css_text) if css_text else {}
+        .color-hex {{
+            font-family: 'Courier New', monospace;
+            font-weight: bold;
+            color: #2c3e50;
+        }}
         
-        css_content = f"""/* 
-   Modern CSS Variables and Utilities (2025)
-   Generated from: {data.url}
-   Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-   Web Style Extractor v2.0 - Modern CSS Edition
-*/
-
-:root {{
-    /* === Traditional Color Palette === */
-{chr(10).join(f'    --color-{i+1}: {color};  /* Color {i+1} */' for i, color in enumerate(data.colors))}
+        .font-table {{
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+            background: white;
+            border-radius: 8px;
+            overflow: hidden;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }}
+        
+        .font-table th {{
+            background: #34495e;
+            color: white;
+            padding: 12px;
+            text-align: left;
+        }}
+        
+        .font-table td {{
+            padding: 12px;
+            border-bottom: 1px solid #ecf0f1;
+        }}
+        
+        .font-table tr:hover {{
+            background: #f8f9fa;
+        }}
+        
+        .font-example {{
+            font-size: 16px;
+            padding: 8px;
+            background: #f8f9fa;
+            border-radius: 4px;
+            margin: 5px 0;
+            border: 1px solid #e9ecef;
+        }}
+        
+        .usage-badge {{
+            display: inline-block;
+            background: #3498db;
+            color: white;
+            padding: 2px 8px;
+            border-radius: 12px;
+            font-size: 12px;
+            font-weight: bold;
+        }}
+        
+        .usage-badge.monospace {{ background: #e74c3c; }}
+        .usage-badge.system {{ background: #27ae60; }}
+        .usage-badge.serif {{ background: #f39c12; }}
+        .usage-badge.keyword {{ background: #9b59b6; }}
+        .usage-badge.fallback {{ background: #95a5a6; }}
+        
+        .files-list {{
+            background: #f8f9fa;
+            padding: 15px;
+            border-radius: 5px;
+            border: 1px solid #e9ecef;
+        }}
+        
+        .files-list ul {{
+            margin: 0;
+            padding-left: 20px;
+        }}
+        
+        code {{
+            background: #f8f9fa;
+            padding: 2px 5px;
+            border-radius: 3px;
+            font-family: 'Courier New', monospace;
+        }}
+        
+        .highlight {{ background: linear-gradient(120deg, #a8edea 0%, #fed6e3 100%); padding: 2px 5px; border-radius: 3px; }}
+    </style>
+</head>
+<body>
+    <h1>🎨 Style Guide for {domain}</h1>
     
-    /* === Modern OKLCH Colors === */
-{chr(10).join(f'    --color-{i+1}-oklch: {ColorConverter.hex_to_oklch_string(color)};  /* Modern equivalent */' for i, color in enumerate(data.colors))}
+    <div class="meta-info">
+        <strong>Extracted from:</strong> <a href="{url}" target="_blank">{url}</a><br>
+        <strong>Generated:</strong> {generated}<br>
+        <strong>Format:</strong> {format_name}
+    </div>
     
-    /* === Named Color System === */
-    --color-primary: {data.colors[0] if data.colors else '#000000'};
-    --color-primary-oklch: {ColorConverter.hex_to_oklch_string(data.colors[0]) if data.colors else 'oklch(50% 0.1 0deg)'};
-    --color-secondary: {data.colors[1] if len(data.colors) > 1 else '#666666'};
-    --color-secondary-oklch: {ColorConverter.hex_to_oklch_string(data.colors[1]) if len(data.colors) > 1 else 'oklch(50% 0.1 120deg)'};
+    <h2>📊 Quick Stats</h2>
+    <div class="stats-grid">
+        <div class="stat-card">
+            <div class="stat-number">{n_colors}</div>
+            <div class="stat-label">Colors Found</div>
+        </div>
+        <div class="stat-card">
+            <div class="stat-number">{n_fonts}</div>
+            <div class="stat-label">Fonts Found</div>
+        </div>
+        <div class="stat-card">
+            <div class="stat-number">3</div>
+            <div class="stat-label">Output Files</div>
+        </div>
+    </div>
     
-    /* === Dynamic Color Variations (CSS 2025) === */
-    --color-primary-light: oklch(from var(--color-primary-oklch) calc(l + 0.2) c h);
-    --color-primary-dark: oklch(from var(--color-primary-oklch) calc(l - 0.2) c h);
-    --color-secondary-light: oklch(from var(--color-secondary-oklch) calc(l + 0.2) c h);
-    --color-secondary-dark: oklch(from var(--color-secondary-oklch) calc(l - 0.2) c h);
+    <h2>📁 Files in this Project</h2>
+    <div class="files-list">
+        <ul>
+            <li><strong><code>styles.{file_ext}</code></strong> - Main {format_name} output file</li>
+            <li><strong><code>metadata.txt</code></strong> - Detailed extraction information</li>
+            <li><strong><code>README.md</code></strong> - Markdown documentation</li>
+            <li><strong><code>README.html</code></strong> - This HTML file with live font previews</li>
+        </ul>
+    </div>
     
-    /* === Design Token System === */
-    --space-3xs: 0.25rem;  /* 4px */
-    --space-2xs: 0.5rem;   /* 8px */ 
-    --space-xs: 0.75rem;   /* 12px */
-    --space-sm: 1rem;      /* 16px */
-    --space-md: 1.5rem;    /* 24px */
-    --space-lg: 2rem;      /* 32px */
-    --space-xl: 3rem;      /* 48px */
-    --space-2xl: 4rem;     /* 64px */
+    <h2>🎨 Color Palette</h2>
+    <div class="color-grid">''')
+
+_HTML_COLOR_CARD: Final[str] = _minify_html_template('''
+        <div class="color-card">
+            <div class="color-swatch" style="background-color: {color};">
+                {color}
+            </div>
+            <div class="color-info">
+                <div class="color-hex">{color}</div>
+                <div>Color {index}</div>
+            </div>
+        </div>''')
+
+_HTML_README_MIDDLE: Final[str] = _minify_html_template('''
+    </div>
+
+    <h2>🔤 Font Stack with Live Previews</h2>
+    <p>The table below shows each font <span class="highlight">actually rendered</span> so you can see exactly how they look:</p>
     
-    /* === Typography Scale === */
-    --font-primary: {data.fonts[0] if data.fonts else 'Arial'};
-    --font-secondary: {data.fonts[1] if len(data.fonts) > 1 else 'sans-serif'};
-    --font-mono: {next((font for font in data.fonts if 'mono' in font.lower() or font.lower() in ['consolas', 'courier']), 'monospace')};
-    --font-stack: {data.body_font};
+    <table class="font-table">
+        <thead>
+            <tr>
+                <th>Font Name</th>
+                <th>Live Example</th>
+                <th>Usage</th>
+            </tr>
+        </thead>
+        <tbody>''')
+
+_HTML_FONT_ROW: Final[str] = _minify_html_template('''
+            <tr>
+                <td><code>{font}</code></td>
+                <td>
+                    <div class="font-example" style="font-family: {font}, monospace, sans-serif;">
+                        The quick brown fox jumps over the lazy dog<br>
+                        <small>ABCDEFGHIJKLMNOPQRSTUVWXYZ abcdefghijklmnopqrstuvwxyz 0123456789</small>
+                    </div>
+                </td>
+                <td>
+                    <span class="usage-badge {usage_class}">{usage}</span>
+                </td>
+            </tr>''')
+
+_HTML_README_TAIL: Final[str] = _minify_html_template('''
+        </tbody>
+    </table>
     
-    /* === Fluid Typography System === */
-    --font-size-fluid-xs: clamp(0.75rem, 1.5vw, 0.875rem);
-    --font-size-fluid-sm: clamp(0.875rem, 2vw, 1rem);
-    --font-size-fluid-base: clamp(1rem, 2.5vw, 1.125rem);
-    --font-size-fluid-lg: clamp(1.125rem, 3vw, 1.375rem);
-    --font-size-fluid-xl: clamp(1.375rem, 4vw, 1.875rem);
-    --font-size-fluid-2xl: clamp(1.875rem, 5vw, 2.5rem);
+    <h2>🎯 Key Extracted Styles</h2>
+    <div class="meta-info">
+        <strong>Body Background:</strong> <code>{body_bg}</code><br>
+        <strong>Body Font:</strong> <code>{body_font}</code><br>
+        <strong>Heading Color:</strong> <code>{heading_color}</code><br>
+        <strong>Link Color:</strong> <code>{link_color}</code>
+    </div>
     
-    /* === Extracted Styles === */
-    --body-background: {data.body_bg};
-    --heading-color: {data.heading_color};
-    --link-color: {data.link_color};
-    --text-color: {data.heading_color};
+    <h2>🚀 How to Use This Information</h2>
     
-    /* === Shadow System === */
-    --shadow-xs: 0 1px 2px 0 rgba(0, 0, 0, 0.05);
-    --shadow-sm: 0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06);
-    --shadow-md: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-    --shadow-lg: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);
-}}"""
+    <h3>📝 For MediaWiki Documentation</h3>
+    <p>Open <code>styles.mediawiki</code> and copy the content directly into your MediaWiki page. The color tables and font lists are ready to use!</p>
+    
+    <h3>💾 For Development</h3>
+    <p>Use <code>styles.json</code> for programmatic access to all extracted data. Perfect for generating CSS variables or design tokens.</p>
+    
+    <h3>👀 For Design Review</h3>
+    <p>Use this HTML file to visually review the website's typography and color choices with your team.</p>
+    
+    <footer style="margin-top: 40px; padding-top: 20px; border-top: 1px solid #eee; text-align: center; color: #7f8c8d;">
+        <p>Generated by <a href="https://github.com/your-repo/style-extractor" target="_blank">{display_name}</a></p>
+    </footer>
+</body>
+</html>''')
 
-        # Add extracted CSS custom properties if found
-        if custom_props:
-            css_content += f"""
+# README.md is rendered the same way as README.html: constant template
+# text stored once at module level, with per-render placeholder
+# substitution via str.format_map
+_MD_README_HEAD: Final[str] = """# 🎨 Style Guide for {domain}
 
-/* === Existing CSS Custom Properties (Extracted) === */
-:root {{
-{chr(10).join(f'    {prop}: {value};' for prop, value in sorted(custom_props.items()))}
-}}"""
+**Extracted from:** [{url}]({url})  
+**Generated:** {generated}  
+**Format:** {format_upper}
+**🚀 {display_name}** - {format_description}
 
-        css_content += f"""
+## 📊 Comprehensive Analysis
 
-/* === Modern Color Utility Classes === */
-{chr(10).join(f'.bg-color-{i+1} {{ background: var(--color-{i+1}); }}{chr(10)}.bg-color-{i+1}-oklch {{ background: var(--color-{i+1}-oklch); }}{chr(10)}.text-color-{i+1} {{ color: var(--color-{i+1}); }}{chr(10)}.text-color-{i+1}-oklch {{ color: var(--color-{i+1}-oklch); }}' for i, color in enumerate(data.colors))}
+### 🎨 **Color System**
+- **Colors Found:** {n_colors} unique colors extracted
+- **Modern Support:** All colors converted to OKLCH color space
+- **Dynamic Variations:** Light/dark variants generated using CSS relative color syntax
+- **Semantic Mapping:** Colors classified by usage (primary, secondary, background, text)
 
-/* === Typography Utilities === */
-.font-primary {{ font-family: var(--font-primary), var(--font-stack); }}
-.font-secondary {{ font-family: var(--font-secondary), var(--font-stack); }}
-.font-mono {{ font-family: var(--font-mono), monospace; }}
+### 🔤 **Typography System** 
+- **Fonts Found:** {n_fonts} font families detected
+- **Font Classification:** Automatically categorized (serif, sans-serif, monospace, display)
+- **Fluid Typography:** Responsive font sizing with clamp() functions generated
+- **Font Stack Optimization:** Fallback-aware declarations created
 
-/* === Fluid Typography Classes === */
-.text-fluid-xs {{ font-size: var(--font-size-fluid-xs); }}
-.text-fluid-sm {{ font-size: var(--font-size-fluid-sm); }}
-.text-fluid-base {{ font-size: var(--font-size-fluid-base); }}
-.text-fluid-lg {{ font-size: var(--font-size-fluid-lg); }}
-.text-fluid-xl {{ font-size: var(--font-size-fluid-xl); }}
-.text-fluid-2xl {{ font-size: var(--font-size-fluid-2xl); }}
+### 🎯 **Key Style Properties**
+- **Body Background:** `{body_bg}`
+- **Primary Text:** `{heading_color}`
+- **Link Colors:** `{link_color}`
+- **Font Family:** Optimized font stacks with fallbacks
 
-/* === Spacing Utilities === */
-.space-3xs {{ margin: var(--space-3xs); }}
-.space-2xs {{ margin: var(--space-2xs); }}
-.space-xs {{ margin: var(--space-xs); }}
-.space-sm {{ margin: var(--space-sm); }}
-.space-md {{ margin: var(--space-md); }}
-.space-lg {{ margin: var(--space-lg); }}
+## 📁 Project Structure
 
-/* === Modern Component Base Styles === */
-body {{
-    background: var(--body-background);
-    font-family: var(--font-stack);
-    color: var(--text-color);
-    font-size: var(--font-size-fluid-base);
-}}
+- **`styles.{file_ext}`** - {format_description}
+- **`metadata.txt`** - Comprehensive extraction details and analysis
+- **`README.md`** - This documentation file  
+- **`README.html`** - 🌟 **Interactive preview with live font rendering!**
 
-h1 {{ 
-    color: var(--heading-color);
-    font-family: var(--font-primary), var(--font-stack);
-    font-size: var(--font-size-fluid-2xl);
-}}
+## 🎨 Complete Color Palette
 
-h2 {{ 
-    color: var(--heading-color);
-    font-size: var(--font-size-fluid-xl);
-}}
+| # | Hex Code | OKLCH Equivalent | Visual Sample |
+|---|----------|------------------|---------------|
+"""
 
-h3 {{ 
-    color: var(--heading-color);
-    font-size: var(--font-size-fluid-lg);
-}}
+_MD_README_MIDDLE: Final[str] = """
 
-a {{
-    color: var(--link-color);
-    transition: color 0.2s ease;
-    
-    &:hover {{
-        color: var(--color-primary-light);
-    }}
-}}
+## 🔤 Font Analysis & Classification
 
-/* === Modern Button Component === */
-.btn {{
-    display: inline-flex;
-    align-items: center;
-    gap: var(--space-2xs);
-    padding: var(--space-xs) var(--space-sm);
-    border-radius: 0.375rem;
-    font-weight: 500;
-    font-size: var(--font-size-fluid-sm);
-    transition: all 0.2s ease;
-    border: none;
-    cursor: pointer;
-    
-    &:hover {{
-        transform: translateY(-1px);
-        box-shadow: var(--shadow-md);
-    }}
-    
-    &:focus-visible {{
-        outline: 2px solid var(--color-primary);
-        outline-offset: 2px;
-    }}
-}}
+| Font Family | Classification | Usage Context | Fallback Strategy |
+|-------------|----------------|---------------|-------------------|
+"""
 
-.btn--primary {{
-    background: var(--color-primary);
-    color: white;
-    
-    &:hover {{
-        background: var(--color-primary-dark);
-    }}
-}}
+_MD_README_TAIL: Final[str] = """
 
-.btn--secondary {{
-    background: transparent;
-    color: var(--color-primary);
-    border: 1px solid var(--color-primary);
-    
-    &:hover {{
-        background: var(--color-primary);
-        color: white;
-    }}
-}}"""
+**💡 See Live Font Rendering:** Open `README.html` in your browser to see exactly how each font renders with real text samples!
 
-        # Add modern CSS features if detected
-        if modern_features['container_queries']:
-            css_content += f"""
+{format_howto}
 
-/* === Container Queries Detected === */
-.container-aware {{
-    container-type: inline-size;
-    container-name: component;
-}}
+## 🚀 Advanced Features Available
 
-@container component (min-width: 400px) {{
-    .responsive-content {{ display: grid; }}
-}}"""
+### 🎨 **Modern CSS Output** (`--output modern-css`)
+- **OKLCH Color Space**: Future-proof color definitions with better perceptual uniformity
+- **Container Queries**: Modern responsive design patterns that respond to container size
+- **CSS Nesting**: Native CSS nesting without preprocessors
+- **Fluid Typography**: Responsive text scaling using clamp() functions
+- **Dynamic Color Variations**: CSS relative color syntax for automatic light/dark variants
 
-        if modern_features['has_selectors']:
-            css_content += f"""
+### ⚡ **Tailwind Configuration** (`--output tailwind`)
+- **Custom Color Palettes**: Extracted colors mapped to Tailwind color scales
+- **Font Family Integration**: Detected fonts configured as Tailwind font families
+- **Spacing System**: Consistent spacing tokens derived from the design
+- **Component-Ready**: Drop into any Tailwind project immediately
 
-/* === :has() Selector Patterns Detected === */
-.form:has(input:invalid) {{
-    border-color: var(--color-danger);
-}}
+### 🎯 **Design Tokens** (`--output design-tokens`)
+- **Style Dictionary Compatible**: JSON format ready for multi-platform generation
+- **Semantic Color Mapping**: Meaningful color names (primary, secondary, background, text)
+- **Typography Scale**: Fluid font sizing with both relative and static values
+- **Component Tokens**: Button, input, and common component styling variables
 
-.card:has(img) {{
-    grid-template-areas: "image content";
-}}"""
+## 🔧 Developer Integration
 
-        css_content += f"""
+### 📦 **Import into Your Project**
+```bash
+# Copy the generated file to your project
+cp styles.{file_ext} src/styles/
 
-/* === Usage Examples ===
+# For Tailwind projects
+cp styles.js tailwind.config.js
 
-Example 1: Modern color usage
-.my-component {{
-    background: var(--color-primary-oklch);
-    color: var(--color-primary-light);
-}}
+# For Design System projects  
+cp styles.json tokens/design-tokens.json
+```
 
-Example 2: Fluid typography
-.heading {{
-    font-size: var(--font-size-fluid-xl);
-    line-height: 1.2;
-}}
+### 🎨 **Use in Your CSS**
+```css
+/* Import generated variables */
+@import 'styles.css';
 
-Example 3: Design token spacing
-.card {{
-    padding: var(--space-md);
-    margin-bottom: var(--space-lg);
-    border-radius: var(--space-xs);
+/* Use extracted colors */
+.my-component {{
+  background: var(--color-primary);
+  color: var(--color-text-primary);
+  font-family: var(--font-primary);
 }}
+```
 
-Example 4: Modern button with container queries
-<div class="container-aware">
-    <button class="btn btn--primary">Click me</button>
-</div>
+### ⚛️ **React/Vue Integration**
+```javascript
+// Import design tokens
+import tokens from './styles.json';
 
-*/"""
-        return css_content
+// Use in your components
+const MyComponent = () => (
+  <div style={{{{
+    backgroundColor: tokens.designSystem.colors.semantic.background.value,
+    color: tokens.designSystem.colors.semantic['text-primary'].value
+  }}}}>
+    Styled with extracted design tokens!
+  </div>
+);
+```
 
-    def generate_css_output(self, data: WebStyleData) -> str:
-        """Generate CSS variables and utility classes"""
-        css_content = f"""/* 
-   CSS Variables and Utilities
-   Generated from: {data.url}
-   Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-   Web Style Extractor v1.0
-*/
+## 📚 Learn More
 
-:root {{
-    /* === Color Palette === */
-{chr(10).join(f'    --color-{i+1}: {color};  /* Color {i+1} */' for i, color in enumerate(data.colors))}
-    
-    /* === Named Colors === */
-    --color-primary: {data.colors[0] if data.colors else '#000000'};
-    --color-secondary: {data.colors[1] if len(data.colors) > 1 else '#666666'};
-    --color-accent: {data.colors[2] if len(data.colors) > 2 else '#999999'};
-    
-    /* === Typography === */
-    --font-primary: {data.fonts[0] if data.fonts else 'Arial'};
-    --font-secondary: {data.fonts[1] if len(data.fonts) > 1 else 'sans-serif'};
-    --font-mono: {next((font for font in data.fonts if 'mono' in font.lower() or font.lower() in ['consolas', 'courier']), 'monospace')};
-    --font-stack: {data.body_font};
-    
-    /* === Extracted Styles === */
-    --body-background: {data.body_bg};
-    --heading-color: {data.heading_color};
-    --link-color: {data.link_color};
-    --text-color: {data.heading_color};
-}}
+### 🔗 **Documentation Links**
+- **[{display_name} Documentation](../../../README.md)** - Complete feature guide
+- **[Modern CSS Features Guide](../../../web-style-extractor-modern-features.md)** - Latest CSS capabilities
+- **[MediaWiki Templates](../../../docs/mediawiki-usage.md)** - Wiki integration guide
+- **[Design Token Usage](../../../docs/design-tokens.md)** - Style Dictionary workflows
 
-/* === Color Utility Classes === */
-{chr(10).join(f'.bg-color-{i+1} {{ background-color: var(--color-{i+1}); }}{chr(10)}.text-color-{i+1} {{ color: var(--color-{i+1}); }}{chr(10)}.border-color-{i+1} {{ border-color: var(--color-{i+1}); }}' for i, color in enumerate(data.colors))}
+### 🎯 **Next Steps**
+1. **Review the extracted styles** in `README.html` for visual validation
+2. **Choose your output format** based on your project needs
+3. **Integrate the generated code** into your development workflow
+4. **Customize and extend** the extracted design system as needed
 
-/* === Typography Utility Classes === */
-.font-primary {{ font-family: var(--font-primary), var(--font-stack); }}
-.font-secondary {{ font-family: var(--font-secondary), var(--font-stack); }}
-.font-mono {{ font-family: var(--font-mono), monospace; }}
+---
 
-/* === Layout Utility Classes === */
-.bg-body {{ background: var(--body-background); }}
-.text-heading {{ color: var(--heading-color); }}
-.text-link {{ color: var(--link-color); }}
+**🚀 Generated by {display_name}** - Professional CSS analysis and extraction tool  
+✨ **Advanced Features:** OKLCH color space • Design tokens • Modern CSS • Multi-format output
+"""
 
-/* === Component Base Styles === */
-body {{
-    background: var(--body-background);
-    font-family: var(--font-stack);
-    color: var(--text-color);
-}}
+class WebStyleExtractor:
+    # Chrome startup dominates per-URL runtime, so one headless instance is
+    # created lazily and shared by every extractor in the process
+    _driver = None
+    _driver_lock = threading.Lock()
 
-h1, h2, h3, h4, h5, h6 {{
-    color: var(--heading-color);
-    font-family: var(--font-primary), var(--font-stack);
-}}
+    def __init__(self, url: str):
+        self.url = url
+        # Parse the URL once up front; the www-stripped hostname doubles as
+        # the default project name so main() never re-parses
+        self.domain = urlparse(url).netloc.removeprefix('www.')
+        self.project_name = self.domain
+        self.session = requests.Session()
+        # Let requests negotiate Accept-Encoding itself: it only advertises
+        # codings it can transparently decode (brotli needs an extra package)
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
+        # Keep-alive pooling: stylesheets and images usually come from the
+        # same origin, so reusing the TCP+TLS connection avoids a handshake
+        # per resource. Transient gateway errors get a short retry.
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
-a {{
-    color: var(--link-color);
-}}
+    def fetch_page_content(self) -> Optional[BeautifulSoup]:
+        try:
+            response = self.session.get(self.url, timeout=10)
+            response.raise_for_status()
+            # Pass raw bytes so the parser handles encoding detection itself
+            return BeautifulSoup(response.content, _SOUP_PARSER)
+        except requests.RequestException as e:
+            logging.error(f"Error fetching page: {e}")
+            return None
 
-code, pre {{
-    font-family: var(--font-mono), monospace;
-}}
+    def get_all_css(self, soup: BeautifulSoup) -> str:
+        # One walk over the tree instead of three separate find_all traversals;
+        # fragments are collected per kind and joined once at the end, since
+        # += on a growing string turns quadratic on style-heavy pages
+        inline_parts = []
+        style_parts = []
+        css_urls = []
+
+        for tag in soup.descendants:
+            if not isinstance(tag, bs4.element.Tag):
+                continue
+
+            style_attr = tag.get('style')
+            if style_attr:
+                inline_parts.append(str(style_attr))
+
+            if tag.name == 'style':
+                style_content = tag.string
+                if style_content:
+                    style_parts.append(str(style_content))
+            elif tag.name == 'link' and 'stylesheet' in (tag.get('rel') or ()):
+                href = tag.get('href')
+                if not href:
+                    continue
 
-/* === Color Palette Classes === */
-.palette-1 {{ --current-color: var(--color-1); }}
-.palette-2 {{ --current-color: var(--color-2); }}
-.palette-3 {{ --current-color: var(--color-3); }}
-.palette-4 {{ --current-color: var(--color-4); }}
-.palette-5 {{ --current-color: var(--color-5); }}
+                css_url = str(href)
+                if not css_url.startswith(('http', '//')):
+                    css_url = urljoin(self.url, css_url)
+                elif css_url.startswith('//'):
+                    css_url = f"https:{css_url}"
 
-/* Use with: background: var(--current-color); or color: var(--current-color); */
+                css_urls.append(css_url)
 
-/* === Responsive Font Sizes === */
-:root {{
-    --font-size-xs: 0.75rem;
-    --font-size-sm: 0.875rem;
-    --font-size-base: 1rem;
-    --font-size-lg: 1.125rem;
-    --font-size-xl: 1.25rem;
-    --font-size-2xl: 1.5rem;
-    --font-size-3xl: 1.875rem;
-    --font-size-4xl: 2.25rem;
-}}
+        parts = inline_parts + style_parts
 
-.text-xs {{ font-size: var(--font-size-xs); }}
-.text-sm {{ font-size: var(--font-size-sm); }}
-.text-base {{ font-size: var(--font-size-base); }}
-.text-lg {{ font-size: var(--font-size-lg); }}
-.text-xl {{ font-size: var(--font-size-xl); }}
-.text-2xl {{ font-size: var(--font-size-2xl); }}
-.text-3xl {{ font-size: var(--font-size-3xl); }}
-.text-4xl {{ font-size: var(--font-size-4xl); }}
+        if css_urls:
+            # Fetching is network-bound, so overlap the downloads; the pooled
+            # session is shared and executor.map keeps document order.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                parts.extend(filter(None, executor.map(self._fetch_css, css_urls)))
+        return "\n".join(parts)
 
-/* === Usage Examples ===
+    def _fetch_css(self, css_url: str) -> str:
+        """Fetch a single external stylesheet, returning '' on failure"""
+        try:
+            css_response = self.session.get(css_url, timeout=5)
+            css_response.raise_for_status()
+            return css_response.text
+        except requests.RequestException:
+            return ""
+    def extract_colors(self, css_text: str, soup: BeautifulSoup) -> List[str]:
+        # Copy the cached scan result since image colors get appended below
+        normalized_colors = list(_cached_css_scan('colors', css_text, _scan_css_colors))
 
-Example 1: Basic usage
-<div class="bg-color-1 text-color-2 font-primary">
-    Content with extracted colors and fonts
-</div>
+        # Try to extract dominant colors from the first image
+        try:
+            hero_image = soup.find('img')
+            if isinstance(hero_image, bs4.element.Tag):
+                img_src = hero_image.get('src')
+                if img_src:
+                    img_url = str(img_src)
+                    if not img_url.startswith(('http', '//')):
+                        img_url = urljoin(self.url, img_url)
+                    elif img_url.startswith('//'):
+                        img_url = f"https:{img_url}"
 
-Example 2: Component styling
-.my-button {{
-    background: var(--color-primary);
-    color: var(--color-secondary);
-    font-family: var(--font-primary);
-}}
+                    # stream=True skips materializing response.content in
+                    # requests; PIL still buffers the payload internally
+                    # because the raw urllib3 stream is not seekable, so the
+                    # win here is avoiding the second full copy plus letting
+                    # thumbnail() decode JPEGs at reduced scale
+                    with self.session.get(img_url, timeout=5, stream=True) as img_response:
+                        img_response.raise_for_status()
+                        img_response.raw.decode_content = True
+                        img = Image.open(img_response.raw)
+                        img = img.convert('RGB')
+                        # thumbnail() lets libjpeg decode at reduced scale;
+                        # quantization only needs a bounded sample anyway
+                        img.thumbnail((256, 256))
+
+                    normalized_colors.extend(_dominant_colors(img))
+        except (requests.RequestException, UnidentifiedImageError, Exception):
+            pass
 
-Example 3: Theme-aware components
-.card {{
-    background: var(--body-background);
-    color: var(--text-color);
-    border: 1px solid var(--color-accent);
-}}
+        # dict.fromkeys dedupes in C while preserving insertion order
+        return list(dict.fromkeys(normalized_colors))[:10]
 
-*/"""
-        return css_content
-    
-    def generate_tailwind_config(self, data: WebStyleData) -> str:
-        """Generate Tailwind CSS configuration from extracted styles"""
-        # Create color palette
-        colors = {}
-        for i, color in enumerate(data.colors[:10]):  # Limit to 10 colors
-            color_name = f"color-{i+1}"
-            # Try to create a color scale if it's a primary color
-            if i == 0:  # First color becomes 'primary'
-                colors['primary'] = {
-                    '50': self._lighten_color(color, 0.4),
-                    '100': self._lighten_color(color, 0.3),
-                    '200': self._lighten_color(color, 0.2),
-                    '300': self._lighten_color(color, 0.1),
-                    '400': color,
-                    '500': color,  # Base color
-                    '600': self._darken_color(color, 0.1),
-                    '700': self._darken_color(color, 0.2),
-                    '800': self._darken_color(color, 0.3),
-                    '900': self._darken_color(color, 0.4),
-                }
-            else:
-                colors[color_name] = color
-        
-        # Extract font families
-        font_families = {}
-        if data.fonts:
-            font_families['sans'] = data.fonts[:3] if len(data.fonts) >= 3 else data.fonts
-            # Check for monospace fonts
-            mono_fonts = [font for font in data.fonts if 'mono' in font.lower() or font.lower() in ['consolas', 'courier', 'menlo']]
-            if mono_fonts:
-                font_families['mono'] = mono_fonts[:2]
-        
-        # Generate Tailwind config
-        config = f"""// tailwind.config.js - Generated from extracted styles
-// Source: {data.url}
-// Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+    def extract_fonts(self, css_text: str) -> List[str]:
+        # A direct regex scan is an order of magnitude cheaper than having
+        # cssutils build a full stylesheet AST just to find font-family rules
+        fonts = _cached_css_scan('fonts', css_text, _scan_fonts)
 
-module.exports = {{
-  theme: {{
-    extend: {{
-      colors: {{"""
-        
-        # Add colors to config
-        for color_name, color_value in colors.items():
-            if isinstance(color_value, dict):
-                config += f"""
-        '{color_name}': {{"""
-                for shade, shade_value in color_value.items():
-                    config += f"""
-          {shade}: '{shade_value}',"""
-                config += """
-        },"""
-            else:
-                config += f"""
-        '{color_name}': '{color_value}',"""
-        
-        config += """
-      },"""
-        
-        # Add font families if available
-        if font_families:
-            config += """
-      fontFamily: {"""
-            for family_name, family_fonts in font_families.items():
-                if isinstance(family_fonts, list):
-                    fonts_str = "', '".join(family_fonts)
-                    config += f"""
-        '{family_name}': ['{fonts_str}'],"""
-                else:
-                    config += f"""
-        '{family_name}': ['{family_fonts}'],"""
-            config += """
-      },"""
-        
-        # Add custom spacing if needed
-        config += """
-      spacing: {
-        '18': '4.5rem',
-        '88': '22rem',
-      },
-      borderRadius: {
-        'xl': '1rem',
-        '2xl': '1.5rem',
-      }"""
-        
-        config += """
-    }
-  },
-  plugins: [
-    // Add any Tailwind plugins here
-  ]
-}"""
-        
-        return config
+        return [font for font in dict.fromkeys(fonts) if font][:5]
     
-    def generate_design_tokens(self, data: WebStyleData) -> str:
-        """Generate design tokens in JSON format"""
-        import json
-        
-        # Create design token structure
-        tokens = {
-            "designSystem": {
-                "colors": {
-                    "palette": {},
-                    "semantic": {}
-                },
-                "typography": {
-                    "fontFamilies": {},
-                    "fontSizes": {},
-                    "fontWeights": {}
+    def extract_css_custom_properties(self, css_text: str) -> Dict[str, str]:
+        """Extract existing CSS custom properties (CSS variables)"""
+        # Copy the cached dict so caller mutations cannot poison the cache
+        return dict(_cached_css_scan('custom_properties', css_text, _scan_custom_properties))
+
+    def detect_modern_css_features(self, css_text: str) -> Dict[str, List[str]]:
+        """Detect modern CSS features like container queries, nesting, etc."""
+        # Shallow-copy like the scans above; the match lists are read-only
+        # by convention
+        return dict(_cached_css_scan('modern_features', css_text, _scan_modern_features))
+
+    @classmethod
+    def _get_driver(cls):
+        """Lazily create the shared headless Chrome instance"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        with cls._driver_lock:
+            if cls._driver is None:
+                chrome_options = Options()
+                chrome_options.binary_location = r"C:\Program Files\Google\Chrome\Application\chrome.exe"  # Specify Chrome binary location
+                chrome_options.add_argument('--headless=new')
+                chrome_options.add_argument('--log-level=3')
+                chrome_options.add_argument('--disable-gpu')
+                chrome_options.add_argument('--no-sandbox')
+                chrome_options.add_argument('--disable-dev-shm-usage')
+
+                service = Service(ChromeDriverManager().install())
+                cls._driver = webdriver.Chrome(service=service, options=chrome_options)
+                atexit.register(cls._shutdown_driver)
+            return cls._driver
+
+    @classmethod
+    def _shutdown_driver(cls):
+        """Quit the shared driver (registered with atexit)"""
+        with cls._driver_lock:
+            if cls._driver is not None:
+                try:
+                    cls._driver.quit()
+                except Exception:
+                    pass
+                cls._driver = None
+
+    def get_computed_styles(self) -> Dict[str, Any]:
+        from selenium.common.exceptions import WebDriverException
+
+        try:
+            driver = self._get_driver()
+        except WebDriverException as e:
+            logging.error(f"Error creating Chrome WebDriver: {e}")
+            return {
+                'body': {
+                    'background': '#ffffff',
+                    'font_family': 'Arial, sans-serif'
                 },
-                "spacing": {
-                    "scale": {}
+                'headings': {
+                    'color': '#000000'
                 },
-                "borderRadius": {},
-                "shadows": {},
-                "metadata": {
-                    "source": data.url,
-                    "generated": datetime.datetime.now().isoformat(),
-                    "version": "1.0"
+                'links': {
+                    'color': '#0000ee'
                 }
             }
-        }
-        
-        # Add color palette
-        for i, color in enumerate(data.colors):
-            color_name = f"color-{i+1:02d}"
-            tokens["designSystem"]["colors"]["palette"][color_name] = {
-                "value": color,
-                "oklch": ColorConverter.hex_to_oklch_string(color),
-                "type": "color",
-                "description": f"Extracted color #{i+1}"
-            }
-        
-        # Add semantic colors
-        if data.body_bg:
-            tokens["designSystem"]["colors"]["semantic"]["background"] = {
-                "value": data.body_bg,
-                "type": "color",
-                "description": "Primary background color"
-            }
-        
-        if data.heading_color:
-            tokens["designSystem"]["colors"]["semantic"]["text-primary"] = {
-                "value": data.heading_color,
-                "type": "color", 
-                "description": "Primary text color"
-            }
-            
-        if data.link_color:
-            tokens["designSystem"]["colors"]["semantic"]["text-link"] = {
-                "value": data.link_color,
-                "type": "color",
-                "description": "Link color"
-            }
-        
-        # Add font families
-        for i, font in enumerate(data.fonts):
-            font_type = "monospace" if any(mono in font.lower() for mono in ['mono', 'consolas', 'courier', 'menlo']) else "sans-serif"
-            tokens["designSystem"]["typography"]["fontFamilies"][f"font-{i+1:02d}"] = {
-                "value": [font],
-                "type": f"fontFamily.{font_type}",
-                "description": f"Font family #{i+1}"
-            }
-        
-        # Add spacing scale (based on common design system)
-        spacing_scale = {
-            "3xs": {"value": "0.25rem", "px": "4px"},
-            "2xs": {"value": "0.5rem", "px": "8px"},
-            "xs": {"value": "0.75rem", "px": "12px"},
-            "sm": {"value": "1rem", "px": "16px"},
-            "md": {"value": "1.5rem", "px": "24px"},
-            "lg": {"value": "2rem", "px": "32px"},
-            "xl": {"value": "3rem", "px": "48px"},
-            "2xl": {"value": "4rem", "px": "64px"},
-            "3xl": {"value": "6rem", "px": "96px"}
-        }
-        
-        for name, values in spacing_scale.items():
-            tokens["designSystem"]["spacing"]["scale"][name] = {
-                "value": values["value"],
-                "pixel": values["px"],
-                "type": "dimension",
-                "description": f"Spacing {name}"
-            }
-        
-        # Add font sizes (fluid typography scale)
-        font_sizes = {
-            "xs": {"value": "clamp(0.75rem, 1.5vw, 0.875rem)", "static": "0.75rem"},
-            "sm": {"value": "clamp(0.875rem, 2vw, 1rem)", "static": "0.875rem"},
-            "base": {"value": "clamp(1rem, 2.5vw, 1.125rem)", "static": "1rem"},
-            "lg": {"value": "clamp(1.125rem, 3vw, 1.375rem)", "static": "1.125rem"},
-            "xl": {"value": "clamp(1.375rem, 4vw, 1.875rem)", "static": "1.375rem"},
-            "2xl": {"value": "clamp(1.875rem, 5vw, 2.5rem)", "static": "1.875rem"}
-        }
-        
-        for name, values in font_sizes.items():
-            tokens["designSystem"]["typography"]["fontSizes"][name] = {
-                "value": values["value"],
-                "static": values["static"],
-                "type": "fontSize.fluid",
-                "description": f"Font size {name}"
-            }
-        
-        # Add border radius
-        border_radius = {
-            "none": "0",
-            "sm": "0.125rem",
-            "base": "0.25rem", 
-            "md": "0.375rem",
-            "lg": "0.5rem",
-            "xl": "0.75rem",
-            "2xl": "1rem",
-            "full": "9999px"
-        }
-        
-        for name, value in border_radius.items():
-            tokens["designSystem"]["borderRadius"][name] = {
-                "value": value,
-                "type": "borderRadius",
-                "description": f"Border radius {name}"
+
+        styles = {
+            'body': {
+                'background': '#ffffff',
+                'font_family': 'Arial, sans-serif'
+            },
+            'headings': {
+                'color': '#000000'
+            },
+            'links': {
+                'color': '#0000ee'
             }
-        
-        # Add shadows
-        shadows = {
-            "xs": "0 1px 2px 0 rgba(0, 0, 0, 0.05)",
-            "sm": "0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",
-            "base": "0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)",
-            "md": "0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)",
-            "lg": "0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05)",
-            "xl": "0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04)",
-            "2xl": "0 25px 50px -12px rgba(0, 0, 0, 0.25)"
         }
-        
-        for name, value in shadows.items():
-            tokens["designSystem"]["shadows"][name] = {
-                "value": value,
-                "type": "boxShadow",
-                "description": f"Box shadow {name}"
-            }
-        
-        return json.dumps(tokens, indent=2)
-    
-    def _lighten_color(self, hex_color: str, amount: float) -> str:
-        """Lighten a hex color by a given amount"""
-        try:
-            # Convert hex to RGB
-            hex_color = hex_color.lstrip('#')
-            rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            
-            # Lighten each component
-            lightened = tuple(min(255, int(c + (255 - c) * amount)) for c in rgb)
-            
-            # Convert back to hex
-            return f"#{lightened[0]:02x}{lightened[1]:02x}{lightened[2]:02x}"
-        except:
-            return hex_color
-    
-    def _darken_color(self, hex_color: str, amount: float) -> str:
-        """Darken a hex color by a given amount"""
+
         try:
-            # Convert hex to RGB
-            hex_color = hex_color.lstrip('#')
-            rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            
-            # Darken each component
-            darkened = tuple(max(0, int(c * (1 - amount))) for c in rgb)
-            
-            # Convert back to hex
-            return f"#{darkened[0]:02x}{darkened[1]:02x}{darkened[2]:02x}"
-        except:
-            return hex_color
-    
-    def create_metadata_file(self, data: WebStyleData, output_dir: Path) -> None:
-        """Create metadata file with extraction information"""
-        metadata_content = f"""Web Style Extraction Metadata
-Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Source URL: {data.url}
-Extractor Version: {__version__}
+            # Reset state instead of quit/relaunch between URLs
+            driver.delete_all_cookies()
+            driver.get(self.url)
 
-Extraction Results:
-- Colors found: {len(data.colors)}
-- Fonts found: {len(data.fonts)}  
-- Body background: {data.body_bg}
-- Body font: {data.body_font}
-- Heading color: {data.heading_color}
-- Link color: {data.link_color}
+            # One script round trip instead of six WebDriver IPC calls
+            result = driver.execute_script("""
+                const body = window.getComputedStyle(document.body);
+                const h1 = document.querySelector('h1');
+                const a = document.querySelector('a');
+                return {
+                    background: body.backgroundColor,
+                    font_family: body.fontFamily,
+                    heading_color: h1 ? window.getComputedStyle(h1).color : null,
+                    link_color: a ? window.getComputedStyle(a).color : null
+                };""") or {}
+
+            styles['body']['background'] = result.get('background') or '#ffffff'
+            styles['body']['font_family'] = result.get('font_family') or 'Arial, sans-serif'
+            styles['headings']['color'] = result.get('heading_color') or '#000000'
+            styles['links']['color'] = result.get('link_color') or '#0000ee'
 
-Colors extracted:
-{chr(10).join(f'  - {color}' for color in data.colors)}
+        except Exception as e:
+            logging.error(f"Error getting computed styles: {e}")
 
-Fonts extracted:
-{chr(10).join(f'  - {font}' for font in data.fonts)}
+        return styles
 
-Extraction method: CSS analysis + computed styles via Chrome WebDriver
-Browser: Chrome (headless mode)
-"""
-        
-        metadata_path = output_dir / "metadata.txt"
-        metadata_path.write_text(metadata_content, encoding='utf-8')
-        logging.info(f"Metadata saved to: {metadata_path}")
-    
-    def create_project_readme(self, data: WebStyleData, output_dir: Path, output_format: str) -> None:
-        """Create a comprehensive project-specific README file"""
-        domain = urlparse(data.url).netloc
-        file_ext = self._get_file_extension(output_format)
-        
-        # Get format-specific descriptions
-        format_description = self._get_format_description(output_format)
-        format_howto = self._get_format_specific_howto(output_format)
-        
-        readme_content = f"""# 🎨 Style Guide for {domain}
+    def extract_styles(self) -> Optional[WebStyleData]:
+        soup = self.fetch_page_content()
+        if not soup:
+            return None
 
-**Extracted from:** [{data.url}]({data.url})  
-**Generated:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
-**Format:** {output_format.upper()}
-**🚀 {get_display_name()}** - {format_description}
+        css_text = self.get_all_css(soup)
+        colors = self.extract_colors(css_text, soup)
+        fonts = self.extract_fonts(css_text)
+        computed_styles = self.get_computed_styles()
 
-## 📊 Comprehensive Analysis
+        return WebStyleData(
+            url=self.url,
+            colors=colors,
+            fonts=fonts,
+            body_bg=computed_styles['body']['background'],
+            heading_color=computed_styles['headings']['color'],
+            link_color=computed_styles['links']['color'],
+            body_font=computed_styles['body']['font_family'],
+            css_text=css_text
+        )
 
-### 🎨 **Color System**
-- **Colors Found:** {len(data.colors)} unique colors extracted
-- **Modern Support:** All colors converted to OKLCH color space
-- **Dynamic Variations:** Light/dark variants generated using CSS relative color syntax
-- **Semantic Mapping:** Colors classified by usage (primary, secondary, background, text)
+    def generate_template(self, data: WebStyleData, output_format: str) -> str:
+        # O(1) dispatch for the data-driven formats; template-file formats
+        # (mediawiki, html) fall through to the file-based renderer
+        generator = self._GENERATORS.get(output_format)
+        if generator is not None:
+            return generator(self, data)
+        return self._generate_file_template(data, output_format)
+
+    def _generate_file_template(self, data: WebStyleData, output_format: str) -> str:
+        """Render a format backed by template files in templates/"""
+        template_dir = Path(__file__).parent / 'templates'
+        if not template_dir.exists():
+            logging.error("Template directory not found.")
+            return ""
 
-### 🔤 **Typography System** 
-- **Fonts Found:** {len(data.fonts)} font families detected
-- **Font Classification:** Automatically categorized (serif, sans-serif, monospace, display)
-- **Fluid Typography:** Responsive font sizing with clamp() functions generated
-- **Font Stack Optimization:** Fallback-aware declarations created
+        # Fix file extensions for MediaWiki templates
+        if output_format == 'mediawiki':
+            base_template_path = template_dir / f'base_{output_format}.wiki'
+            color_table_path = template_dir / f'color_table_{output_format}.wiki'
+            font_table_path = template_dir / f'font_table_{output_format}.wiki'
+        else:
+            base_template_path = template_dir / f'base_{output_format}.{output_format}'
+            color_table_path = template_dir / f'color_table_{output_format}.{output_format}'
+            font_table_path = template_dir / f'font_table_{output_format}.{output_format}'
 
-### 🎯 **Key Style Properties**
-- **Body Background:** `{data.body_bg}`
-- **Primary Text:** `{data.heading_color}`
-- **Link Colors:** `{data.link_color}`
-- **Font Family:** Optimized font stacks with fallbacks
+        try:
+            if not all([base_template_path.exists(), color_table_path.exists(), font_table_path.exists()]):
+                logging.error(f"One or more template files not found for format: {output_format}")
+                logging.error(f"Looking for: {base_template_path}, {color_table_path}, {font_table_path}")
+                return ""
+            base_template = _read_template(str(base_template_path), base_template_path.stat().st_mtime_ns)
+            color_table_template = _read_template(str(color_table_path), color_table_path.stat().st_mtime_ns)
+            font_table_template = _read_template(str(font_table_path), font_table_path.stat().st_mtime_ns)
+        except Exception as e:
+            logging.error(f"Error reading template files: {e}")
+            return ""
 
-## 📁 Project Structure
+        color_rows = []
+        for color in data.colors:
+            color_rows.append(color_table_template.format(color=color))
 
-- **`styles.{file_ext}`** - {format_description}
-- **`metadata.txt`** - Comprehensive extraction details and analysis
-- **`README.md`** - This documentation file  
-- **`README.html`** - 🌟 **Interactive preview with live font rendering!**
+        font_rows = []
+        for font in data.fonts:
+            font_rows.append(font_table_template.format(font=font))
 
-## 🎨 Complete Color Palette
+        return base_template.format(
+            url=data.url,
+            body_bg=data.body_bg,
+            body_font=data.body_font,
+            heading_color=data.heading_color,
+            link_color=data.link_color,
+            color_rows="\n".join(color_rows),
+            font_rows="\n".join(font_rows)
+        )
 
-| # | Hex Code | OKLCH Equivalent | Visual Sample |
-|---|----------|------------------|---------------|
-{chr(10).join(f'| {i+1} | `{color}` | `{ColorConverter.hex_to_oklch_string(color)}` | ![{color}](https://img.shields.io/badge/-{color.replace("#", "")}-{color.replace("#", "")}?style=flat-square) |' for i, color in enumerate(data.colors))}
+    def generate_json_output(self, data: WebStyleData) -> str:
+        """Generate JSON output format"""
+        json_data = {
+            "url": data.url,
+            "extraction_date": datetime.datetime.now().isoformat() + "Z",
+            "styles": {
+                "body_background": data.body_bg,
+                "body_font": data.body_font,
+                "heading_color": data.heading_color,
+                "link_color": data.link_color
+            },
+            "colors": data.colors,
+            "fonts": data.fonts,
+            "metadata": {
+                "extractor_version": "1.0",
+                "total_colors_found": len(data.colors),
+                "total_fonts_found": len(data.fonts),
+                "extraction_method": "css_analysis_and_computed_styles",
+                "browser_used": "Chrome (headless)"
+            }
+        }
+        return _json_dumps(json_data)
+    
+    def generate_modern_css_output(self, data: WebStyleData, css_text: str = "") -> str:
+        """Generate modern CSS with OKLCH colors and advanced features"""
+        custom_props = self.extract_css_custom_properties(css_text) if css_text else {}
+        modern_features = self.detect_modern_css_features(css_text) if css_text else {}
 
-## 🔤 Font Analysis & Classification
+        # Convert the whole palette in one vectorized batch and pre-join the
+        # per-color line blocks so the f-string below only interpolates
+        # ready-made strings
+        oklch_map = _hex_to_oklch_map(data.colors)
+        oklch_colors = [oklch_map[color] for color in data.colors]
+        palette_lines = _NL.join(
+            [f'    --color-{i+1}: {color};  /* Color {i+1} */'
+             for i, color in enumerate(data.colors)])
+        oklch_lines = _NL.join(
+            [f'    --color-{i+1}-oklch: {oklch};  /* Modern equivalent */'
+             for i, oklch in enumerate(oklch_colors)])
+        utility_lines = _NL.join(
+            [f'.bg-color-{n} {{ background: var(--color-{n}); }}\n'
+             f'.bg-color-{n}-oklch {{ background: var(--color-{n}-oklch); }}\n'
+             f'.text-color-{n} {{ color: var(--color-{n}); }}\n'
+             f'.text-color-{n}-oklch {{ color: var(--color-{n}-oklch); }}'
+             for n in range(1, len(data.colors) + 1)])
+        primary_oklch = oklch_colors[0] if oklch_colors else 'oklch(50% 0.1 0deg)'
+        secondary_oklch = oklch_colors[1] if len(oklch_colors) > 1 else 'oklch(50% 0.1 120deg)'
+
+        css_content = f"""/*
+   Modern CSS Variables and Utilities (2025)
+   Generated from: {data.url}
+   Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+   Web Style Extractor v2.0 - Modern CSS Edition
+*/
 
-| Font Family | Classification | Usage Context | Fallback Strategy |
-|-------------|----------------|---------------|-------------------|
-{chr(10).join(f'| `{font}` | {self._get_font_classification(font)} | {self._get_font_usage(font)} | {self._get_font_fallback(font)} |' for font in data.fonts)}
+:root {{
+    /* === Traditional Color Palette === */
+{palette_lines}
 
-**💡 See Live Font Rendering:** Open `README.html` in your browser to see exactly how each font renders with real text samples!
+    /* === Modern OKLCH Colors === */
+{oklch_lines}
 
-{format_howto}
+    /* === Named Color System === */
+    --color-primary: {data.colors[0] if data.colors else '#000000'};
+    --color-primary-oklch: {primary_oklch};
+    --color-secondary: {data.colors[1] if len(data.colors) > 1 else '#666666'};
+    --color-secondary-oklch: {secondary_oklch};
+    
+    /* === Dynamic Color Variations (CSS 2025) === */
+    --color-primary-light: oklch(from var(--color-primary-oklch) calc(l + 0.2) c h);
+    --color-primary-dark: oklch(from var(--color-primary-oklch) calc(l - 0.2) c h);
+    --color-secondary-light: oklch(from var(--color-secondary-oklch) calc(l + 0.2) c h);
+    --color-secondary-dark: oklch(from var(--color-secondary-oklch) calc(l - 0.2) c h);
+    
+    /* === Design Token System === */
+    --space-3xs: 0.25rem;  /* 4px */
+    --space-2xs: 0.5rem;   /* 8px */ 
+    --space-xs: 0.75rem;   /* 12px */
+    --space-sm: 1rem;      /* 16px */
+    --space-md: 1.5rem;    /* 24px */
+    --space-lg: 2rem;      /* 32px */
+    --space-xl: 3rem;      /* 48px */
+    --space-2xl: 4rem;     /* 64px */
+    
+    /* === Typography Scale === */
+    --font-primary: {data.fonts[0] if data.fonts else 'Arial'};
+    --font-secondary: {data.fonts[1] if len(data.fonts) > 1 else 'sans-serif'};
+    --font-mono: {next((font for font in data.fonts if 'mono' in font.lower() or font.lower() in ['consolas', 'courier']), 'monospace')};
+    --font-stack: {data.body_font};
+    
+    /* === Fluid Typography System === */
+    --font-size-fluid-xs: clamp(0.75rem, 1.5vw, 0.875rem);
+    --font-size-fluid-sm: clamp(0.875rem, 2vw, 1rem);
+    --font-size-fluid-base: clamp(1rem, 2.5vw, 1.125rem);
+    --font-size-fluid-lg: clamp(1.125rem, 3vw, 1.375rem);
+    --font-size-fluid-xl: clamp(1.375rem, 4vw, 1.875rem);
+    --font-size-fluid-2xl: clamp(1.875rem, 5vw, 2.5rem);
+    
+    /* === Extracted Styles === */
+    --body-background: {data.body_bg};
+    --heading-color: {data.heading_color};
+    --link-color: {data.link_color};
+    --text-color: {data.heading_color};
+    
+    /* === Shadow System === */
+    --shadow-xs: 0 1px 2px 0 rgba(0, 0, 0, 0.05);
+    --shadow-sm: 0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06);
+    --shadow-md: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
+    --shadow-lg: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);
+}}"""
 
-## 🚀 Advanced Features Available
+        # Add extracted CSS custom properties if found
+        if custom_props:
+            custom_prop_lines = _NL.join(
+                [f'    {prop}: {value};' for prop, value in sorted(custom_props.items())])
+            css_content += f"""
 
-### 🎨 **Modern CSS Output** (`--output modern-css`)
-- **OKLCH Color Space**: Future-proof color definitions with better perceptual uniformity
-- **Container Queries**: Modern responsive design patterns that respond to container size
-- **CSS Nesting**: Native CSS nesting without preprocessors
-- **Fluid Typography**: Responsive text scaling using clamp() functions
-- **Dynamic Color Variations**: CSS relative color syntax for automatic light/dark variants
+/* === Existing CSS Custom Properties (Extracted) === */
+:root {{
+{custom_prop_lines}
+}}"""
 
-### ⚡ **Tailwind Configuration** (`--output tailwind`)
-- **Custom Color Palettes**: Extracted colors mapped to Tailwind color scales
-- **Font Family Integration**: Detected fonts configured as Tailwind font families
-- **Spacing System**: Consistent spacing tokens derived from the design
-- **Component-Ready**: Drop into any Tailwind project immediately
+        css_content += f"""
 
-### 🎯 **Design Tokens** (`--output design-tokens`)
-- **Style Dictionary Compatible**: JSON format ready for multi-platform generation
-- **Semantic Color Mapping**: Meaningful color names (primary, secondary, background, text)
-- **Typography Scale**: Fluid font sizing with both relative and static values
-- **Component Tokens**: Button, input, and common component styling variables
+/* === Modern Color Utility Classes === */
+{utility_lines}
 
-## 🔧 Developer Integration
+/* === Typography Utilities === */
+.font-primary {{ font-family: var(--font-primary), var(--font-stack); }}
+.font-secondary {{ font-family: var(--font-secondary), var(--font-stack); }}
+.font-mono {{ font-family: var(--font-mono), monospace; }}
 
-### 📦 **Import into Your Project**
-```bash
-# Copy the generated file to your project
-cp styles.{file_ext} src/styles/
+/* === Fluid Typography Classes === */
+.text-fluid-xs {{ font-size: var(--font-size-fluid-xs); }}
+.text-fluid-sm {{ font-size: var(--font-size-fluid-sm); }}
+.text-fluid-base {{ font-size: var(--font-size-fluid-base); }}
+.text-fluid-lg {{ font-size: var(--font-size-fluid-lg); }}
+.text-fluid-xl {{ font-size: var(--font-size-fluid-xl); }}
+.text-fluid-2xl {{ font-size: var(--font-size-fluid-2xl); }}
 
-# For Tailwind projects
-cp styles.js tailwind.config.js
+/* === Spacing Utilities === */
+.space-3xs {{ margin: var(--space-3xs); }}
+.space-2xs {{ margin: var(--space-2xs); }}
+.space-xs {{ margin: var(--space-xs); }}
+.space-sm {{ margin: var(--space-sm); }}
+.space-md {{ margin: var(--space-md); }}
+.space-lg {{ margin: var(--space-lg); }}
 
-# For Design System projects  
-cp styles.json tokens/design-tokens.json
-```
-
-### 🎨 **Use in Your CSS**
-```css
-/* Import generated variables */
-@import 'styles.css';
-
-/* Use extracted colors */
-.my-component {{
-  background: var(--color-primary);
-  color: var(--color-text-primary);
-  font-family: var(--font-primary);
+/* === Modern Component Base Styles === */
+body {{
+    background: var(--body-background);
+    font-family: var(--font-stack);
+    color: var(--text-color);
+    font-size: var(--font-size-fluid-base);
 }}
-```
-
-### ⚛️ **React/Vue Integration**
-```javascript
-// Import design tokens
-import tokens from './styles.json';
-
-// Use in your components
-const MyComponent = () => (
-  <div style={{{{
-    backgroundColor: tokens.designSystem.colors.semantic.background.value,
-    color: tokens.designSystem.colors.semantic['text-primary'].value
-  }}}}>
-    Styled with extracted design tokens!
-  </div>
-);
-```
-
-## 📚 Learn More
 
-### 🔗 **Documentation Links**
-- **[{get_display_name()} Documentation](../../../README.md)** - Complete feature guide
-- **[Modern CSS Features Guide](../../../web-style-extractor-modern-features.md)** - Latest CSS capabilities
-- **[MediaWiki Templates](../../../docs/mediawiki-usage.md)** - Wiki integration guide
-- **[Design Token Usage](../../../docs/design-tokens.md)** - Style Dictionary workflows
+h1 {{ 
+    color: var(--heading-color);
+    font-family: var(--font-primary), var(--font-stack);
+    font-size: var(--font-size-fluid-2xl);
+}}
 
-### 🎯 **Next Steps**
-1. **Review the extracted styles** in `README.html` for visual validation
-2. **Choose your output format** based on your project needs
-3. **Integrate the generated code** into your development workflow
-4. **Customize and extend** the extracted design system as needed
+h2 {{ 
+    color: var(--heading-color);
+    font-size: var(--font-size-fluid-xl);
+}}
 
----
+h3 {{ 
+    color: var(--heading-color);
+    font-size: var(--font-size-fluid-lg);
+}}
 
-**🚀 Generated by {get_display_name()}** - Professional CSS analysis and extraction tool  
-✨ **Advanced Features:** OKLCH color space • Design tokens • Modern CSS • Multi-format output
-"""
-        
-        readme_path = output_dir / "README.md"
-        readme_path.write_text(readme_content, encoding='utf-8')
-        logging.info(f"Project README saved to: {readme_path}")
+a {{
+    color: var(--link-color);
+    transition: color 0.2s ease;
     
-    def _get_file_extension(self, output_format: str) -> str:
-        """Get the correct file extension for output format"""
-        return get_file_extension(output_format)
+    &:hover {{
+        color: var(--color-primary-light);
+    }}
+}}
+
+/* === Modern Button Component === */
+.btn {{
+    display: inline-flex;
+    align-items: center;
+    gap: var(--space-2xs);
+    padding: var(--space-xs) var(--space-sm);
+    border-radius: 0.375rem;
+    font-weight: 500;
+    font-size: var(--font-size-fluid-sm);
+    transition: all 0.2s ease;
+    border: none;
+    cursor: pointer;
     
-    def _get_format_description(self, output_format: str) -> str:
-        """Get description for each output format"""
-        config = get_format_config(output_format)
-        return config['full_description']
+    &:hover {{
+        transform: translateY(-1px);
+        box-shadow: var(--shadow-md);
+    }}
     
-    def _get_format_specific_howto(self, output_format: str) -> str:
-        """Get format-specific How to Use section"""
-        return get_howto_section(output_format)
+    &:focus-visible {{
+        outline: 2px solid var(--color-primary);
+        outline-offset: 2px;
+    }}
+}}
 
-    def _get_usage_section(self, output_format: str, file_ext: str) -> str:
-        """Generate format-specific usage instructions"""
-        if output_format == 'modern-css':
-            return """## 🚀 Using Your Modern CSS
+.btn--primary {{
+    background: var(--color-primary);
+    color: white;
+    
+    &:hover {{
+        background: var(--color-primary-dark);
+    }}
+}}
 
-### 🎨 **OKLCH Colors & Modern Features**
-```css
-/* Traditional colors for legacy support */
-.component {
-  background: var(--color-1); /* #hex fallback */
-}
+.btn--secondary {{
+    background: transparent;
+    color: var(--color-primary);
+    border: 1px solid var(--color-primary);
+    
+    &:hover {{
+        background: var(--color-primary);
+        color: white;
+    }}
+}}"""
 
-/* Modern OKLCH colors for better color accuracy */
-.modern-component {
-  background: var(--color-1-oklch); /* oklch(54.3% 0.227 252.5deg) */
-}
+        # Add modern CSS features if detected
+        if modern_features['container_queries']:
+            css_content += f"""
 
-/* Dynamic color variations (CSS 2025) */
-.light-variant {
-  background: var(--color-primary-light); /* Automatically lighter */
-}
-```
+/* === Container Queries Detected === */
+.container-aware {{
+    container-type: inline-size;
+    container-name: component;
+}}
 
-### 📦 **Container Queries**
-```css
-/* Container-aware responsive design */
-.card {
-  container-type: inline-size;
-}
+@container component (min-width: 400px) {{
+    .responsive-content {{ display: grid; }}
+}}"""
 
-@container (min-width: 400px) {
-  .card-content { display: grid; }
-}
-```
+        if modern_features['has_selectors']:
+            css_content += f"""
 
-### 📏 **Fluid Typography**
-```css
-/* Responsive text that scales smoothly */
-h1 {
-  font-size: var(--font-size-fluid-xl); /* clamp(1.875rem, 5vw, 2.5rem) */
-}
-```"""
-            
-        elif output_format == 'tailwind':
-            return f"""## ⚡ Using Your Tailwind Config
+/* === :has() Selector Patterns Detected === */
+.form:has(input:invalid) {{
+    border-color: var(--color-danger);
+}}
 
-### 📦 **Installation**
-```bash
-# Replace your tailwind.config.js with the generated file
-cp styles.{file_ext} tailwind.config.js
+.card:has(img) {{
+    grid-template-areas: "image content";
+}}"""
 
-# Or merge with existing config
-```
+        css_content += f"""
 
-### 🎨 **Using Extracted Colors**
-```html
-<!-- Use extracted color palettes -->
-<div class="bg-primary-500 text-primary-50">
-  Styled with extracted GitHub colors!
-</div>
+/* === Usage Examples ===
 
-<!-- Custom color utilities -->
-<div class="bg-color-3 text-color-1">
-  Direct color usage
-</div>
-```
+Example 1: Modern color usage
+.my-component {{
+    background: var(--color-primary-oklch);
+    color: var(--color-primary-light);
+}}
 
-### 🔤 **Typography Classes**
-```html
-<!-- Use detected font families -->
-<h1 class="font-sans text-fluid-xl">
-  Rendered with extracted fonts
-</h1>
-```"""
-            
-        elif output_format == 'design-tokens':
-            return f"""## 🎯 Using Your Design Tokens
+Example 2: Fluid typography
+.heading {{
+    font-size: var(--font-size-fluid-xl);
+    line-height: 1.2;
+}}
 
-### 📦 **Style Dictionary Integration**
-```javascript
-// Install Style Dictionary
-npm install style-dictionary
+Example 3: Design token spacing
+.card {{
+    padding: var(--space-md);
+    margin-bottom: var(--space-lg);
+    border-radius: var(--space-xs);
+}}
 
-// Configure build (style-dictionary.config.js)
-module.exports = {{
-  source: ['styles.{file_ext}'],
-  platforms: {{
-    scss: {{
-      transformGroup: 'scss',
-      buildPath: 'src/styles/',
-      files: [{{
-        destination: '_tokens.scss',
-        format: 'scss/variables'
-      }}]
-    }}
-  }}
-}};
-```
+Example 4: Modern button with container queries
+<div class="container-aware">
+    <button class="btn btn--primary">Click me</button>
+</div>
 
-### 🎨 **Direct Usage**
-```javascript
-// Import tokens in JavaScript
-import tokens from './styles.json';
+*/"""
+        return css_content
 
-// Access color values
-const primaryColor = tokens.designSystem.colors.palette['color-01'].value;
-const primaryColorOKLCH = tokens.designSystem.colors.palette['color-01'].oklch;
+    def generate_css_output(self, data: WebStyleData) -> str:
+        """Generate CSS variables and utility classes"""
+        # Pre-join the per-color line blocks so the template below only
+        # substitutes finished strings
+        palette_lines = _NL.join(
+            [f'    --color-{i+1}: {color};  /* Color {i+1} */'
+             for i, color in enumerate(data.colors)])
+        utility_lines = _NL.join(
+            [f'.bg-color-{n} {{ background-color: var(--color-{n}); }}\n'
+             f'.text-color-{n} {{ color: var(--color-{n}); }}\n'
+             f'.border-color-{n} {{ border-color: var(--color-{n}); }}'
+             for n in range(1, len(data.colors) + 1)])
+
+        css_content = f"""/*
+   CSS Variables and Utilities
+   Generated from: {data.url}
+   Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+   Web Style Extractor v1.0
+*/
 
-// Use in React/Vue components
-const theme = {{
-  colors: {{
-    primary: tokens.designSystem.colors.semantic['text-primary'].value,
-    background: tokens.designSystem.colors.semantic.background.value
-  }}
-}};
-```"""
-            
-        else:
-            return f"""## 🚀 How to Use This {output_format.upper()} File
+:root {{
+    /* === Color Palette === */
+{palette_lines}
+    
+    /* === Named Colors === */
+    --color-primary: {data.colors[0] if data.colors else '#000000'};
+    --color-secondary: {data.colors[1] if len(data.colors) > 1 else '#666666'};
+    --color-accent: {data.colors[2] if len(data.colors) > 2 else '#999999'};
+    
+    /* === Typography === */
+    --font-primary: {data.fonts[0] if data.fonts else 'Arial'};
+    --font-secondary: {data.fonts[1] if len(data.fonts) > 1 else 'sans-serif'};
+    --font-mono: {next((font for font in data.fonts if 'mono' in font.lower() or font.lower() in ['consolas', 'courier']), 'monospace')};
+    --font-stack: {data.body_font};
+    
+    /* === Extracted Styles === */
+    --body-background: {data.body_bg};
+    --heading-color: {data.heading_color};
+    --link-color: {data.link_color};
+    --text-color: {data.heading_color};
+}}
 
-### 📝 **For Documentation**
-- Copy content directly into your documentation system
-- Use the color swatches and font information for design reviews
-- Share with design teams for visual style validation
+/* === Color Utility Classes === */
+{utility_lines}
 
-### 💾 **For Development**
-- Import the generated file into your project
-- Use the structured data for automated workflows
-- Integrate with your existing design system tools
+/* === Typography Utility Classes === */
+.font-primary {{ font-family: var(--font-primary), var(--font-stack); }}
+.font-secondary {{ font-family: var(--font-secondary), var(--font-stack); }}
+.font-mono {{ font-family: var(--font-mono), monospace; }}
 
-### 📊 **For Analysis**
-- Analyze color usage patterns and accessibility
-- Compare font choices across different websites
-- Export data for further processing and reporting"""
-    
-    def _get_font_usage(self, font: str) -> str:
-        """Determine the usage category for a font"""
-        font_lower = font.lower()
-        
-        if 'mono' in font_lower or font_lower in ['consolas', 'courier', 'menlo', 'monaco']:
-            return "Monospace/Code"
-        elif font_lower in ['-apple-system', 'blinkmacsystemfont', 'segoe ui', 'roboto', 'helvetica neue', 'arial']:
-            return "UI/System"
-        elif font_lower in ['times', 'georgia', 'serif']:
-            return "Serif/Reading"
-        elif font_lower in ['inherit', 'initial', 'unset']:
-            return "CSS Keyword"
-        elif 'sans-serif' in font_lower or 'sans' in font_lower:
-            return "Sans-serif Fallback"
-        elif 'serif' in font_lower:
-            return "Serif Fallback"
-        else:
-            return "Display/Custom"
+/* === Layout Utility Classes === */
+.bg-body {{ background: var(--body-background); }}
+.text-heading {{ color: var(--heading-color); }}
+.text-link {{ color: var(--link-color); }}
+
+/* === Component Base Styles === */
+body {{
+    background: var(--body-background);
+    font-family: var(--font-stack);
+    color: var(--text-color);
+}}
+
+h1, h2, h3, h4, h5, h6 {{
+    color: var(--heading-color);
+    font-family: var(--font-primary), var(--font-stack);
+}}
+
+a {{
+    color: var(--link-color);
+}}
+
+code, pre {{
+    font-family: var(--font-mono), monospace;
+}}
+
+/* === Color Palette Classes === */
+.palette-1 {{ --current-color: var(--color-1); }}
+.palette-2 {{ --current-color: var(--color-2); }}
+.palette-3 {{ --current-color: var(--color-3); }}
+.palette-4 {{ --current-color: var(--color-4); }}
+.palette-5 {{ --current-color: var(--color-5); }}
+
+/* Use with: background: var(--current-color); or color: var(--current-color); */
+
+/* === Responsive Font Sizes === */
+:root {{
+    --font-size-xs: 0.75rem;
+    --font-size-sm: 0.875rem;
+    --font-size-base: 1rem;
+    --font-size-lg: 1.125rem;
+    --font-size-xl: 1.25rem;
+    --font-size-2xl: 1.5rem;
+    --font-size-3xl: 1.875rem;
+    --font-size-4xl: 2.25rem;
+}}
+
+.text-xs {{ font-size: var(--font-size-xs); }}
+.text-sm {{ font-size: var(--font-size-sm); }}
+.text-base {{ font-size: var(--font-size-base); }}
+.text-lg {{ font-size: var(--font-size-lg); }}
+.text-xl {{ font-size: var(--font-size-xl); }}
+.text-2xl {{ font-size: var(--font-size-2xl); }}
+.text-3xl {{ font-size: var(--font-size-3xl); }}
+.text-4xl {{ font-size: var(--font-size-4xl); }}
+
+/* === Usage Examples ===
+
+Example 1: Basic usage
+<div class="bg-color-1 text-color-2 font-primary">
+    Content with extracted colors and fonts
+</div>
+
+Example 2: Component styling
+.my-button {{
+    background: var(--color-primary);
+    color: var(--color-secondary);
+    font-family: var(--font-primary);
+}}
+
+Example 3: Theme-aware components
+.card {{
+    background: var(--body-background);
+    color: var(--text-color);
+    border: 1px solid var(--color-accent);
+}}
+
+*/"""
+        return css_content
     
-    def _get_font_classification(self, font: str) -> str:
-        """Get detailed font classification"""
-        font_lower = font.lower()
+    def generate_tailwind_config(self, data: WebStyleData) -> str:
+        """Generate Tailwind CSS configuration from extracted styles"""
+        # Create color palette
+        colors = {}
+        for i, color in enumerate(data.colors[:10]):  # Limit to 10 colors
+            color_name = f"color-{i+1}"
+            # Try to create a color scale if it's a primary color
+            if i == 0:  # First color becomes 'primary'
+                colors['primary'] = _shade_scale(color) or {
+                    '50': self._lighten_color(color, 0.4),
+                    '100': self._lighten_color(color, 0.3),
+                    '200': self._lighten_color(color, 0.2),
+                    '300': self._lighten_color(color, 0.1),
+                    '400': color,
+                    '500': color,  # Base color
+                    '600': self._darken_color(color, 0.1),
+                    '700': self._darken_color(color, 0.2),
+                    '800': self._darken_color(color, 0.3),
+                    '900': self._darken_color(color, 0.4),
+                }
+            else:
+                colors[color_name] = color
         
-        if 'mono' in font_lower or font_lower in ['consolas', 'courier', 'menlo', 'monaco', 'sfmono-regular']:
-            return "**Monospace** 🔤"
-        elif font_lower in ['-apple-system', 'blinkmacsystemfont', 'segoe ui', 'roboto', 'helvetica neue']:
-            return "**System UI** 💻"
-        elif font_lower in ['times', 'times new roman', 'georgia', 'baskerville']:
-            return "**Serif** 📚"  
-        elif font_lower in ['helvetica', 'arial', 'verdana', 'tahoma']:
-            return "**Sans-serif** ✏️"
-        elif font_lower in ['inherit', 'initial', 'unset', 'auto']:
-            return "**CSS Keyword** ⚙️"
-        elif 'display' in font_lower or 'heading' in font_lower:
-            return "**Display** 🎨"
-        else:
-            return "**Custom** ✨"
-    
-    def _get_font_fallback(self, font: str) -> str:
-        """Get recommended fallback strategy"""
-        font_lower = font.lower()
+        # Extract font families
+        font_families = {}
+        if data.fonts:
+            font_families['sans'] = data.fonts[:3] if len(data.fonts) >= 3 else data.fonts
+            # Check for monospace fonts
+            mono_fonts = [font for font in data.fonts if _MONO_RE.search(font)]
+            if mono_fonts:
+                font_families['mono'] = mono_fonts[:2]
         
-        if 'mono' in font_lower or font_lower in ['consolas', 'courier', 'menlo', 'monaco']:
-            return "`monospace, 'Courier New'`"
-        elif font_lower in ['-apple-system', 'blinkmacsystemfont']:
-            return "`system-ui, sans-serif`" 
-        elif font_lower in ['segoe ui', 'roboto', 'helvetica neue', 'arial']:
-            return "`sans-serif, Arial`"
-        elif font_lower in ['times', 'georgia']:
-            return "`serif, 'Times New Roman'`"
-        elif font_lower in ['inherit', 'initial', 'unset']:
-            return "*Inherits parent*"
-        else:
-            return "`sans-serif` *(generic)*"
+        # Generate Tailwind config; append chunks to a list and join once at
+        # the end instead of growing a string, which re-copies the whole
+        # config on every += once the palette gets large
+        parts = [f"""// tailwind.config.js - Generated from extracted styles
+// Source: {data.url}
+// Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+module.exports = {{
+  theme: {{
+    extend: {{
+      colors: {{"""]
+
+        # Add colors to config
+        for color_name, color_value in colors.items():
+            if isinstance(color_value, dict):
+                parts.append(f"""
+        '{color_name}': {{""")
+                parts.extend(f"""
+          {shade}: '{shade_value}',""" for shade, shade_value in color_value.items())
+                parts.append("""
+        },""")
+            else:
+                parts.append(f"""
+        '{color_name}': '{color_value}',""")
+
+        parts.append("""
+      },""")
+
+        # Add font families if available
+        if font_families:
+            parts.append("""
+      fontFamily: {""")
+            for family_name, family_fonts in font_families.items():
+                if isinstance(family_fonts, list):
+                    fonts_str = "', '".join(family_fonts)
+                    parts.append(f"""
+        '{family_name}': ['{fonts_str}'],""")
+                else:
+                    parts.append(f"""
+        '{family_name}': ['{family_fonts}'],""")
+            parts.append("""
+      },""")
+
+        # Add custom spacing if needed
+        parts.append("""
+      spacing: {
+        '18': '4.5rem',
+        '88': '22rem',
+      },
+      borderRadius: {
+        'xl': '1rem',
+        '2xl': '1.5rem',
+      }""")
+
+        parts.append("""
+    }
+  },
+  plugins: [
+    // Add any Tailwind plugins here
+  ]
+}""")
+
+        return ''.join(parts)
     
-    def create_project_html_readme(self, data: WebStyleData, output_dir: Path, output_format: str) -> None:
-        """Create an HTML README that actually renders fonts correctly"""
-        domain = urlparse(data.url).netloc
-        format_config = get_format_config(output_format)
-        file_ext = format_config['file_extension']
-        
-        html_content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>🎨 Style Guide for {domain}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            line-height: 1.6;
-            color: #333;
-            background: #fff;
-        }}
-        
-        h1 {{ color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; }}
-        h2 {{ color: #34495e; margin-top: 30px; }}
-        h3 {{ color: #7f8c8d; }}
-        
-        .meta-info {{
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 5px;
-            margin: 20px 0;
-            border-left: 4px solid #3498db;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin: 20px 0;
-        }}
-        
-        .stat-card {{
-            background: #ecf0f1;
-            padding: 15px;
-            border-radius: 5px;
-            text-align: center;
-        }}
-        
-        .stat-number {{ font-size: 24px; font-weight: bold; color: #2980b9; }}
-        .stat-label {{ font-size: 14px; color: #7f8c8d; }}
-        
-        .color-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
-            gap: 15px;
-            margin: 20px 0;
-        }}
-        
-        .color-card {{
-            border: 1px solid #ddd;
-            border-radius: 8px;
-            overflow: hidden;
-            background: white;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        .color-swatch {{
-            height: 80px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: bold;
-            text-shadow: 1px 1px 1px rgba(0,0,0,0.5);
-        }}
-        
-        .color-info {{
-            padding: 10px;
-            text-align: center;
-        }}
-        
-        .color-hex {{
-            font-family: 'Courier New', monospace;
-            font-weight: bold;
-            color: #2c3e50;
-        }}
-        
-        .font-table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-            background: white;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        .font-table th {{
-            background: #34495e;
-            color: white;
-            padding: 12px;
-            text-align: left;
-        }}
-        
-        .font-table td {{
-            padding: 12px;
-            border-bottom: 1px solid #ecf0f1;
-        }}
-        
-        .font-table tr:hover {{
-            background: #f8f9fa;
-        }}
-        
-        .font-example {{
-            font-size: 16px;
-            padding: 8px;
-            background: #f8f9fa;
-            border-radius: 4px;
-            margin: 5px 0;
-            border: 1px solid #e9ecef;
-        }}
-        
-        .usage-badge {{
-            display: inline-block;
-            background: #3498db;
-            color: white;
-            padding: 2px 8px;
-            border-radius: 12px;
-            font-size: 12px;
-            font-weight: bold;
-        }}
-        
-        .usage-badge.monospace {{ background: #e74c3c; }}
-        .usage-badge.system {{ background: #27ae60; }}
-        .usage-badge.serif {{ background: #f39c12; }}
-        .usage-badge.keyword {{ background: #9b59b6; }}
-        .usage-badge.fallback {{ background: #95a5a6; }}
-        
-        .files-list {{
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 5px;
-            border: 1px solid #e9ecef;
-        }}
-        
-        .files-list ul {{
-            margin: 0;
-            padding-left: 20px;
-        }}
-        
-        code {{
-            background: #f8f9fa;
-            padding: 2px 5px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-        }}
+    def generate_design_tokens(self, data: WebStyleData) -> str:
+        """Generate design tokens in JSON format"""
+        # Create design token structure
+        tokens = {
+            "designSystem": {
+                "colors": {
+                    "palette": {},
+                    "semantic": {}
+                },
+                "typography": {
+                    "fontFamilies": {},
+                    "fontSizes": {},
+                    "fontWeights": {}
+                },
+                "spacing": {
+                    "scale": {}
+                },
+                "borderRadius": {},
+                "shadows": {},
+                "metadata": {
+                    "source": data.url,
+                    "generated": datetime.datetime.now().isoformat(),
+                    "version": "1.0"
+                }
+            }
+        }
         
-        .highlight {{ background: linear-gradient(120deg, #a8edea 0%, #fed6e3 100%); padding: 2px 5px; border-radius: 3px; }}
-    </style>
-</head>
-<body>
-    <h1>🎨 Style Guide for {domain}</h1>
-    
-    <div class="meta-info">
-        <strong>Extracted from:</strong> <a href="{data.url}" target="_blank">{data.url}</a><br>
-        <strong>Generated:</strong> {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>
-        <strong>Format:</strong> {format_config['name']}
-    </div>
-    
-    <h2>📊 Quick Stats</h2>
-    <div class="stats-grid">
-        <div class="stat-card">
-            <div class="stat-number">{len(data.colors)}</div>
-            <div class="stat-label">Colors Found</div>
-        </div>
-        <div class="stat-card">
-            <div class="stat-number">{len(data.fonts)}</div>
-            <div class="stat-label">Fonts Found</div>
-        </div>
-        <div class="stat-card">
-            <div class="stat-number">3</div>
-            <div class="stat-label">Output Files</div>
-        </div>
-    </div>
-    
-    <h2>📁 Files in this Project</h2>
-    <div class="files-list">
-        <ul>
-            <li><strong><code>styles.{file_ext}</code></strong> - Main {format_config['name']} output file</li>
-            <li><strong><code>metadata.txt</code></strong> - Detailed extraction information</li>
-            <li><strong><code>README.md</code></strong> - Markdown documentation</li>
-            <li><strong><code>README.html</code></strong> - This HTML file with live font previews</li>
-        </ul>
-    </div>
-    
-    <h2>🎨 Color Palette</h2>
-    <div class="color-grid">
-        {chr(10).join(f'''
-        <div class="color-card">
-            <div class="color-swatch" style="background-color: {color};">
-                {color}
-            </div>
-            <div class="color-info">
-                <div class="color-hex">{color}</div>
-                <div>Color {i+1}</div>
-            </div>
-        </div>''' for i, color in enumerate(data.colors))}
-    </div>
-    
-    <h2>🔤 Font Stack with Live Previews</h2>
-    <p>The table below shows each font <span class="highlight">actually rendered</span> so you can see exactly how they look:</p>
-    
-    <table class="font-table">
-        <thead>
-            <tr>
-                <th>Font Name</th>
-                <th>Live Example</th>
-                <th>Usage</th>
-            </tr>
-        </thead>
-        <tbody>
-            {chr(10).join(f'''
-            <tr>
-                <td><code>{font}</code></td>
-                <td>
-                    <div class="font-example" style="font-family: {font}, monospace, sans-serif;">
-                        The quick brown fox jumps over the lazy dog<br>
-                        <small>ABCDEFGHIJKLMNOPQRSTUVWXYZ abcdefghijklmnopqrstuvwxyz 0123456789</small>
-                    </div>
-                </td>
-                <td>
-                    <span class="usage-badge {self._get_font_css_class(self._get_font_usage(font))}">{self._get_font_usage(font)}</span>
-                </td>
-            </tr>''' for font in data.fonts)}
-        </tbody>
-    </table>
-    
-    <h2>🎯 Key Extracted Styles</h2>
-    <div class="meta-info">
-        <strong>Body Background:</strong> <code>{data.body_bg}</code><br>
-        <strong>Body Font:</strong> <code>{data.body_font}</code><br>
-        <strong>Heading Color:</strong> <code>{data.heading_color}</code><br>
-        <strong>Link Color:</strong> <code>{data.link_color}</code>
-    </div>
-    
-    <h2>🚀 How to Use This Information</h2>
+        # Bind the nested sections once instead of chasing the same index
+        # chain on every assignment below
+        palette = tokens["designSystem"]["colors"]["palette"]
+        semantic = tokens["designSystem"]["colors"]["semantic"]
+        font_families = tokens["designSystem"]["typography"]["fontFamilies"]
+
+        # Add color palette
+        for i, color in enumerate(data.colors):
+            palette[f"color-{i+1:02d}"] = {
+                "value": color,
+                "oklch": ColorConverter.hex_to_oklch_string(color),
+                "type": "color",
+                "description": f"Extracted color #{i+1}"
+            }
+
+        # Add semantic colors
+        if data.body_bg:
+            semantic["background"] = {
+                "value": data.body_bg,
+                "type": "color",
+                "description": "Primary background color"
+            }
+
+        if data.heading_color:
+            semantic["text-primary"] = {
+                "value": data.heading_color,
+                "type": "color",
+                "description": "Primary text color"
+            }
+
+        if data.link_color:
+            semantic["text-link"] = {
+                "value": data.link_color,
+                "type": "color",
+                "description": "Link color"
+            }
+
+        # Add font families
+        for i, font in enumerate(data.fonts):
+            font_type = "monospace" if _MONO_RE.search(font) else "sans-serif"
+            font_families[f"font-{i+1:02d}"] = {
+                "value": [font],
+                "type": f"fontFamily.{font_type}",
+                "description": f"Font family #{i+1}"
+            }
+        
+        # The spacing / font-size / border-radius / shadow sections carry no
+        # extracted data; reuse the shared expansions
+        spacing, font_sizes, border_radius, shadows = _constant_token_sections()
+        tokens["designSystem"]["spacing"]["scale"] = spacing
+        tokens["designSystem"]["typography"]["fontSizes"] = font_sizes
+        tokens["designSystem"]["borderRadius"] = border_radius
+        tokens["designSystem"]["shadows"] = shadows
+
+        return _json_dumps(tokens)
+
+    # Format-name -> generator dispatch for generate_template; one dict
+    # lookup replaces the chained string compares. Defined after the
+    # generator methods so the class body can reference them directly.
+    _GENERATORS = {
+        'json': generate_json_output,
+        'css': generate_css_output,
+        'modern-css': lambda self, data: self.generate_modern_css_output(data, data.css_text),
+        'tailwind': generate_tailwind_config,
+        'design-tokens': generate_design_tokens,
+    }
+
+    def _lighten_color(self, hex_color: str, amount: float) -> str:
+        """Lighten a hex color by a given amount"""
+        try:
+            # bytes.fromhex / bytes.hex do the hex round-trip in C instead
+            # of slicing and format-spec parsing per channel; keep only the
+            # RGB bytes so #rrggbbaa input still yields 6-digit output, and
+            # pass through shorthand too short to hold three channels
+            rgb = bytes.fromhex(hex_color.lstrip('#'))
+            if len(rgb) < 3:
+                return hex_color
+            lightened = bytes(min(255, int(c + (255 - c) * amount)) for c in rgb[:3])
+            return '#' + lightened.hex()
+        except ValueError:
+            return hex_color
+
+    def _darken_color(self, hex_color: str, amount: float) -> str:
+        """Darken a hex color by a given amount"""
+        try:
+            rgb = bytes.fromhex(hex_color.lstrip('#'))
+            if len(rgb) < 3:
+                return hex_color
+            darkened = bytes(max(0, int(c * (1 - amount))) for c in rgb[:3])
+            return '#' + darkened.hex()
+        except ValueError:
+            return hex_color
     
-    <h3>📝 For MediaWiki Documentation</h3>
-    <p>Open <code>styles.mediawiki</code> and copy the content directly into your MediaWiki page. The color tables and font lists are ready to use!</p>
+    def create_metadata_file(self, data: WebStyleData, output_dir: Path,
+                             now_str: Optional[str] = None) -> None:
+        """Create metadata file with extraction information"""
+        if now_str is None:
+            now_str = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        color_lines = _NL.join([f'  - {color}' for color in data.colors])
+        font_lines = _NL.join([f'  - {font}' for font in data.fonts])
+        metadata_content = f"""Web Style Extraction Metadata
+Generated: {now_str}
+Source URL: {data.url}
+Extractor Version: {__version__}
+
+Extraction Results:
+- Colors found: {len(data.colors)}
+- Fonts found: {len(data.fonts)}  
+- Body background: {data.body_bg}
+- Body font: {data.body_font}
+- Heading color: {data.heading_color}
+- Link color: {data.link_color}
+
+Colors extracted:
+{color_lines}
+
+Fonts extracted:
+{font_lines}
+
+Extraction method: CSS analysis + computed styles via Chrome WebDriver
+Browser: Chrome (headless mode)
+"""
+        
+        metadata_path = output_dir / "metadata.txt"
+        _write_small(metadata_path, metadata_content)
+        logging.info(f"Metadata saved to: {metadata_path}")
     
-    <h3>💾 For Development</h3>
-    <p>Use <code>styles.json</code> for programmatic access to all extracted data. Perfect for generating CSS variables or design tokens.</p>
+    def create_project_readme(self, data: WebStyleData, output_dir: Path, output_format: str,
+                              now_str: Optional[str] = None) -> None:
+        """Create a comprehensive project-specific README file"""
+        if now_str is None:
+            now_str = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        domain = data.domain
+
+        # One config lookup serves the extension, description and howto
+        # section instead of three separate getter round-trips
+        format_config = get_format_config(output_format)
+        file_ext = format_config['file_extension']
+        format_description = format_config['full_description']
+        format_howto = format_config['_howto']
+
+        # Build the table rows as joined blocks up front so the template
+        # below only substitutes ready-made strings. The OKLCH strings for
+        # the whole palette resolve through one batch conversion; results
+        # are shared with the other writers via the module-level cache.
+        oklch_map = _hex_to_oklch_map(data.colors)
+        color_rows = "\n".join(
+            [f'| {i+1} | `{color}` | `{oklch_map[color]}` | ![{color}](https://img.shields.io/badge/-{color.replace("#", "")}-{color.replace("#", "")}?style=flat-square) |'
+             for i, color in enumerate(data.colors)])
+        # One pass over the fonts: resolve all three helper values per font
+        # into a tuple row, then emit the table from the precomputed cells
+        font_cells = [(font, self._get_font_classification(font),
+                       self._get_font_usage(font), self._get_font_fallback(font))
+                      for font in data.fonts]
+        font_rows = "\n".join(
+            [f'| `{font}` | {classification} | {usage} | {fallback} |'
+             for font, classification, usage, fallback in font_cells])
+
+        readme_path = output_dir / "README.md"
+        ctx = {
+            'domain': domain,
+            'url': data.url,
+            'generated': now_str,
+            'format_upper': output_format.upper(),
+            'display_name': get_display_name(),
+            'format_description': format_description,
+            'format_howto': format_howto,
+            'file_ext': file_ext,
+            'n_colors': len(data.colors),
+            'n_fonts': len(data.fonts),
+            'body_bg': data.body_bg,
+            'heading_color': data.heading_color,
+            'link_color': data.link_color,
+        }
+        # Stream head / rows / tail segments into a buffered handle instead
+        # of materializing the whole document as one string first
+        with open(readme_path, 'w', encoding='utf-8', buffering=1 << 16) as fh:
+            fh.write(_MD_README_HEAD.format_map(ctx))
+            fh.write(color_rows)
+            fh.write(_MD_README_MIDDLE.format_map(ctx))
+            fh.write(font_rows)
+            fh.write(_MD_README_TAIL.format_map(ctx))
+        logging.info(f"Project README saved to: {readme_path}")
+
+    def _get_usage_section(self, output_format: str, file_ext: str) -> str:
+        """Generate format-specific usage instructions"""
+        if output_format == 'modern-css':
+            return """## 🚀 Using Your Modern CSS
+
+### 🎨 **OKLCH Colors & Modern Features**
+```css
+/* Traditional colors for legacy support */
+.component {
+  background: var(--color-1); /* #hex fallback */
+}
+
+/* Modern OKLCH colors for better color accuracy */
+.modern-component {
+  background: var(--color-1-oklch); /* oklch(54.3% 0.227 252.5deg) */
+}
+
+/* Dynamic color variations (CSS 2025) */
+.light-variant {
+  background: var(--color-primary-light); /* Automatically lighter */
+}
+```
+
+### 📦 **Container Queries**
+```css
+/* Container-aware responsive design */
+.card {
+  container-type: inline-size;
+}
+
+@container (min-width: 400px) {
+  .card-content { display: grid; }
+}
+```
+
+### 📏 **Fluid Typography**
+```css
+/* Responsive text that scales smoothly */
+h1 {
+  font-size: var(--font-size-fluid-xl); /* clamp(1.875rem, 5vw, 2.5rem) */
+}
+```"""
+            
+        elif output_format == 'tailwind':
+            return f"""## ⚡ Using Your Tailwind Config
+
+### 📦 **Installation**
+```bash
+# Replace your tailwind.config.js with the generated file
+cp styles.{file_ext} tailwind.config.js
+
+# Or merge with existing config
+```
+
+### 🎨 **Using Extracted Colors**
+```html
+<!-- Use extracted color palettes -->
+<div class="bg-primary-500 text-primary-50">
+  Styled with extracted GitHub colors!
+</div>
+
+<!-- Custom color utilities -->
+<div class="bg-color-3 text-color-1">
+  Direct color usage
+</div>
+```
+
+### 🔤 **Typography Classes**
+```html
+<!-- Use detected font families -->
+<h1 class="font-sans text-fluid-xl">
+  Rendered with extracted fonts
+</h1>
+```"""
+            
+        elif output_format == 'design-tokens':
+            return f"""## 🎯 Using Your Design Tokens
+
+### 📦 **Style Dictionary Integration**
+```javascript
+// Install Style Dictionary
+npm install style-dictionary
+
+// Configure build (style-dictionary.config.js)
+module.exports = {{
+  source: ['styles.{file_ext}'],
+  platforms: {{
+    scss: {{
+      transformGroup: 'scss',
+      buildPath: 'src/styles/',
+      files: [{{
+        destination: '_tokens.scss',
+        format: 'scss/variables'
+      }}]
+    }}
+  }}
+}};
+```
+
+### 🎨 **Direct Usage**
+```javascript
+// Import tokens in JavaScript
+import tokens from './styles.json';
+
+// Access color values
+const primaryColor = tokens.designSystem.colors.palette['color-01'].value;
+const primaryColorOKLCH = tokens.designSystem.colors.palette['color-01'].oklch;
+
+// Use in React/Vue components
+const theme = {{
+  colors: {{
+    primary: tokens.designSystem.colors.semantic['text-primary'].value,
+    background: tokens.designSystem.colors.semantic.background.value
+  }}
+}};
+```"""
+            
+        else:
+            return f"""## 🚀 How to Use This {output_format.upper()} File
+
+### 📝 **For Documentation**
+- Copy content directly into your documentation system
+- Use the color swatches and font information for design reviews
+- Share with design teams for visual style validation
+
+### 💾 **For Development**
+- Import the generated file into your project
+- Use the structured data for automated workflows
+- Integrate with your existing design system tools
+
+### 📊 **For Analysis**
+- Analyze color usage patterns and accessibility
+- Compare font choices across different websites
+- Export data for further processing and reporting"""
     
-    <h3>👀 For Design Review</h3>
-    <p>Use this HTML file to visually review the website's typography and color choices with your team.</p>
+    def _get_font_usage(self, font: str) -> str:
+        """Determine the usage category for a font"""
+        return _font_usage(font)
+
+    def _get_font_classification(self, font: str) -> str:
+        """Get detailed font classification"""
+        return _font_classification(font)
+
+    def _get_font_fallback(self, font: str) -> str:
+        """Get recommended fallback strategy"""
+        return _font_fallback(font)
     
-    <footer style="margin-top: 40px; padding-top: 20px; border-top: 1px solid #eee; text-align: center; color: #7f8c8d;">
-        <p>Generated by <a href="https://github.com/your-repo/style-extractor" target="_blank">{get_display_name()}</a></p>
-    </footer>
-</body>
-</html>'''
-        
+    def create_project_html_readme(self, data: WebStyleData, output_dir: Path, output_format: str,
+                                   now_str: Optional[str] = None) -> None:
+        """Create an HTML README that actually renders fonts correctly"""
+        if now_str is None:
+            now_str = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        domain = data.domain
+        format_config = get_format_config(output_format)
+        file_ext = format_config['file_extension']
+
         html_readme_path = output_dir / "README.html"
-        html_readme_path.write_text(html_content, encoding='utf-8')
+        # Stream document chunks straight into a buffered handle instead of
+        # assembling the whole page in memory first; peak memory stays at
+        # one chunk rather than the full document
+        with open(html_readme_path, 'w', encoding='utf-8', buffering=1 << 16) as fh:
+            fh.writelines(self._iter_html_readme(data, domain, format_config, file_ext, now_str))
         logging.info(f"HTML README saved to: {html_readme_path}")
-    
+
+    def _iter_html_readme(self, data: WebStyleData, domain: str, format_config, file_ext: str,
+                          now_str: str):
+        """Yield the README.html document as ready-to-write chunks"""
+        yield _HTML_README_HEAD.format_map({
+            'domain': domain,
+            'url': data.url,
+            'generated': now_str,
+            'format_name': format_config['name'],
+            'file_ext': file_ext,
+            'n_colors': len(data.colors),
+            'n_fonts': len(data.fonts),
+        })
+
+        for i, color in enumerate(data.colors):
+            yield _HTML_COLOR_CARD.format_map({'color': color, 'index': i + 1})
+
+        yield _HTML_README_MIDDLE
+
+        for font in data.fonts:
+            usage = _font_usage(font)
+            yield _HTML_FONT_ROW.format_map({
+                'font': font,
+                'usage_class': _font_css_class(usage),
+                'usage': usage,
+            })
+
+        yield _HTML_README_TAIL.format_map({
+            'body_bg': data.body_bg,
+            'body_font': data.body_font,
+            'heading_color': data.heading_color,
+            'link_color': data.link_color,
+            'display_name': get_display_name(),
+        })
+
     def _get_font_css_class(self, usage: str) -> str:
         """Get CSS class for font usage badge"""
-        usage_lower = usage.lower()
-        if 'monospace' in usage_lower or 'code' in usage_lower:
-            return 'monospace'
-        elif 'system' in usage_lower or 'ui' in usage_lower:
-            return 'system'
-        elif 'serif' in usage_lower:
-            return 'serif'
-        elif 'keyword' in usage_lower:
-            return 'keyword'
-        elif 'fallback' in usage_lower:
-            return 'fallback'
-        else:
-            return 'custom'
-def main():
-    # Fix Windows console encoding for emojis
-    import sys
-    import os
-    if os.name == 'nt':  # Windows
-        try:
-            sys.stdout.reconfigure(encoding='utf-8')
-        except:
-            pass  # Fallback if reconfigure fails
-            
-    parser = argparse.ArgumentParser(
-        description='Extract style information from websites and generate organized outputs.',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+        return _font_css_class(usage)
+
+_CLI_EPILOG: Final[str] = """
 Examples:
   %(prog)s https://example.com                    # MediaWiki format (default)
   %(prog)s https://github.com --output json       # JSON format  
@@ -1745,6 +2215,14 @@ Output structure:
   projects/example.com/styles.json         # Design tokens JSON  
   projects/example.com/metadata.txt        # Extraction info
         """
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once per process; repeat calls reuse it"""
+    parser = argparse.ArgumentParser(
+        description='Extract style information from websites and generate organized outputs.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_CLI_EPILOG
     )
     parser.add_argument('url', help='Website URL to analyze')
     parser.add_argument('--output', '-o', default='mediawiki',
@@ -1753,25 +2231,36 @@ Output structure:
     parser.add_argument('--output-file', '-f', help='Custom output file path (overrides organized structure)')
     parser.add_argument('--project-name', '-p', help='Custom project name (instead of domain)')
     parser.add_argument('--debug', '-d', action='store_true', help='Enable debug output')
+    return parser
+
+def main():
+    # Help fast path: render and return before any logging or extraction
+    # state gets set up
+    if len(sys.argv) == 2 and sys.argv[1] in ('-h', '--help'):
+        _build_parser().print_help()
+        return
 
-    args = parser.parse_args()
+    args = _build_parser().parse_args()
 
     # Configure logging based on debug flag
     if args.debug:
         logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
-        # Enable selenium and webdriver-manager logging in debug mode
-        logging.getLogger('selenium').setLevel(logging.INFO)
-        logging.getLogger('webdriver_manager').setLevel(logging.INFO)
+        # Enable selenium and webdriver-manager logging in debug mode, but
+        # only if the browser stack actually got imported for this run
+        if 'selenium' in sys.modules:
+            logging.getLogger('selenium').setLevel(logging.INFO)
+            logging.getLogger('webdriver_manager').setLevel(logging.INFO)
     else:
         logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
-        # Suppress noisy third-party logging
-        logging.getLogger('selenium').setLevel(logging.WARNING)
-        logging.getLogger('webdriver_manager').setLevel(logging.WARNING)
+        # Suppress noisy third-party logging; the WARNING root level already
+        # silences selenium/webdriver_manager without touching their loggers
         logging.getLogger('urllib3').setLevel(logging.WARNING)
 
-    print(f"🎨 {get_display_name()}")
-    print(f"📋 Analyzing: {args.url}")
-    print(f"📄 Format: {args.output.upper()}")
+    # Pre-join each console block and print once: one stdout lock
+    # acquisition and one encoder pass instead of one per line
+    print(f"🎨 {get_display_name()}\n"
+          f"📋 Analyzing: {args.url}\n"
+          f"📄 Format: {args.output.upper()}")
 
     # Extract styles
     extractor = WebStyleExtractor(args.url)
@@ -1792,19 +2281,18 @@ Output structure:
         # Custom output file - use as specified
         output_path = Path(args.output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(template, encoding='utf-8')
+        # Encode once and push the whole payload through a single buffered
+        # binary write instead of the text-IO layer
+        with open(output_path, 'wb', buffering=1 << 17) as f:
+            f.write(template.encode('utf-8'))
         
         print(f"✅ Style file created: {output_path}")
         
     else:
-        # Organized structure in projects folder
-        if args.project_name:
-            project_name = args.project_name
-        else:
-            # Use domain name as project name
-            domain = urlparse(args.url).netloc
-            project_name = domain.replace('www.', '') if domain.startswith('www.') else domain
-        
+        # Organized structure in projects folder; the extractor already
+        # parsed the URL and derived the default project name
+        project_name = args.project_name or extractor.project_name
+
         # Create project directory
         projects_dir = Path(__file__).parent / 'projects'
         project_dir = projects_dir / project_name
@@ -1813,32 +2301,38 @@ Output structure:
         # Determine file extension
         file_ext = get_file_extension(args.output)
             
-        # Write main output file
         output_path = project_dir / f"styles.{file_ext}"
-        output_path.write_text(template, encoding='utf-8')
-        
-        # Create metadata file
-        extractor.create_metadata_file(data, project_dir)
-        
-        # Create project README (markdown)
-        extractor.create_project_readme(data, project_dir, args.output)
-        
-        # Create HTML README with live font previews  
-        extractor.create_project_html_readme(data, project_dir, args.output)
-        
-        print(f"✅ Project created: {project_dir}")
-        print(f"📁 Main output: {output_path}")
-        print(f"📊 Metadata: {project_dir / 'metadata.txt'}")
-        print(f"📖 Project README: {project_dir / 'README.md'}")
-        print(f"🌐 HTML README: {project_dir / 'README.html'} (with live font previews!)")
+
+        # One timestamp for the whole export so the three writers agree
+        # and strftime runs once
+        now_str = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        # The four project files are independent, so their disk I/O can
+        # overlap: main output, metadata, markdown README and HTML README
+        # each get a worker. result() re-raises any writer failure here.
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            writes = [
+                pool.submit(output_path.write_bytes, template.encode('utf-8')),
+                pool.submit(extractor.create_metadata_file, data, project_dir, now_str),
+                pool.submit(extractor.create_project_readme, data, project_dir, args.output, now_str),
+                pool.submit(extractor.create_project_html_readme, data, project_dir, args.output, now_str),
+            ]
+            for write in writes:
+                write.result()
+        
+        print(f"✅ Project created: {project_dir}\n"
+              f"📁 Main output: {output_path}\n"
+              f"📊 Metadata: {project_dir / 'metadata.txt'}\n"
+              f"📖 Project README: {project_dir / 'README.md'}\n"
+              f"🌐 HTML README: {project_dir / 'README.html'} (with live font previews!)")
 
     # Summary
-    print(f"\n📈 Extraction Summary:")
-    print(f"   🎨 Colors found: {len(data.colors)}")
-    print(f"   🔤 Fonts found: {len(data.fonts)}")
-    print(f"   🎯 Body background: {data.body_bg}")
-    print(f"   📝 Heading color: {data.heading_color}")
-    print(f"   🔗 Link color: {data.link_color}")
+    print(f"\n📈 Extraction Summary:\n"
+          f"   🎨 Colors found: {len(data.colors)}\n"
+          f"   🔤 Fonts found: {len(data.fonts)}\n"
+          f"   🎯 Body background: {data.body_bg}\n"
+          f"   📝 Heading color: {data.heading_color}\n"
+          f"   🔗 Link color: {data.link_color}")
     
     # Show format-specific terminal message
     terminal_message = get_terminal_message(args.output, output_path, project_dir / 'README.html')
@@ -6,9 +6,16 @@ __version__ = "1.2.0"
 __release_status__ = "stable"  # options: alpha, beta, rc, stable
 __build_date__ = "2025-09-03"
 
+# Precomputed at import: the helpers below are pure functions of the
+# constants above, so call sites always see the same interned strings
+VERSION_STRING = f"v{__version__}"
+DISPLAY_NAME = (f"Web Style Extractor v{__version__}"
+                if __release_status__ == "stable"
+                else f"Web Style Extractor v{__version__}-{__release_status__}")
+
 def get_version_string():
     """Get formatted version string"""
-    return f"v{__version__}"
+    return VERSION_STRING
 
 def get_full_version_info():
     """Get complete version information"""
@@ -25,7 +32,4 @@ def is_stable():
 
 def get_display_name():
     """Get display name for the application"""
-    if __release_status__ == "stable":
-        return f"Web Style Extractor v{__version__}"
-    else:
-        return f"Web Style Extractor v{__version__}-{__release_status__}"
\ No newline at end of file
+    return DISPLAY_NAME